@@ -16,6 +16,14 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Full-text structures are created with raw DDL next to the tasks table (see
+# app.models.task_models), keep autogenerate from proposing to drop them.
+UNMAPPED_OBJECTS = {'search_vector', 'ix_tasks_search_vector', 'tasks_fts'}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and compare_to is None and name in UNMAPPED_OBJECTS)
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -32,6 +40,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -55,7 +64,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,51 @@
+"""septima migracion
+
+Revision ID: 3f6a8d1c2b57
+Revises: e81f4c3a9d62
+Create Date: 2026-10-18 16:21:09.402716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a8d1c2b57'
+down_revision: Union[str, Sequence[str], None] = 'e81f4c3a9d62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    # Existing tasks take a fresh revision of their owner, so a sync from 0
+    # (or from any revision handed out before this migration) returns them.
+    op.execute(
+        "UPDATE users SET task_revision = task_revision + 1 "
+        "WHERE EXISTS (SELECT 1 FROM tasks WHERE tasks.user_id = users.id)"
+    )
+    op.execute("UPDATE tasks SET revision = (SELECT task_revision FROM users WHERE users.id = tasks.user_id)")
+    op.create_index('ix_tasks_user_id_revision', 'tasks', ['user_id', 'revision'], unique=False)
+    op.create_table(
+        'task_tombstones',
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('task_id', 'revision'),
+    )
+    op.create_index('ix_task_tombstones_user_id_revision', 'task_tombstones', ['user_id', 'revision'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_tombstones_user_id_revision', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_index('ix_tasks_user_id_revision', table_name='tasks')
+    op.drop_column('tasks', 'updated_at')
+    op.drop_column('tasks', 'revision')
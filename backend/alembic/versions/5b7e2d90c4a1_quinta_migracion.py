@@ -0,0 +1,28 @@
+"""quinta migracion
+
+Revision ID: 5b7e2d90c4a1
+Revises: a3c9e1f27b4d
+Create Date: 2026-10-18 12:40:05.118364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d90c4a1'
+down_revision: Union[str, Sequence[str], None] = 'a3c9e1f27b4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('task_revision', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'task_revision')
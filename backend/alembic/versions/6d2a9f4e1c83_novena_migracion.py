@@ -0,0 +1,43 @@
+"""novena migracion
+
+Revision ID: 6d2a9f4e1c83
+Revises: 9c4e7b21d8f3
+Create Date: 2026-10-18 19:11:26.548017
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2a9f4e1c83'
+down_revision: Union[str, Sequence[str], None] = '9c4e7b21d8f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'task_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('task_type', sa.String(length=50), nullable=False),
+        sa.Column('completed', sa.Boolean(), nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'task_type', 'completed'),
+    )
+    # From here on task_service keeps the counters current, they only need
+    # to be seeded once from the existing tasks.
+    op.execute(
+        "INSERT INTO task_counters (user_id, task_type, completed, count) "
+        "SELECT user_id, task_type, completed, count(*) FROM tasks "
+        "WHERE user_id IS NOT NULL GROUP BY user_id, task_type, completed"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('task_counters')
@@ -0,0 +1,71 @@
+"""octava migracion
+
+Revision ID: 9c4e7b21d8f3
+Revises: 3f6a8d1c2b57
+Create Date: 2026-10-18 18:02:47.315902
+
+Full-text search index over the tasks: a generated ``tsvector`` column with
+a GIN index on Postgres, an external content FTS5 table kept in sync by
+triggers on SQLite. Same structures as ``task_models.TASK_SEARCH_DDL``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e7b21d8f3'
+down_revision: Union[str, Sequence[str], None] = '3f6a8d1c2b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_TRIGGERS = ('tasks_fts_insert', 'tasks_fts_delete', 'tasks_fts_update')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Generated column, so Postgres keeps it current on every write; the
+        # model leaves it unmapped and task_service.search_tasks reads it.
+        op.execute(
+            "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED"
+        )
+        op.create_index('ix_tasks_search_vector', 'tasks', ['search_vector'], unique=False, postgresql_using='gin')
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, content='tasks', content_rowid='id')"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+            "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+            "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+            "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); "
+            "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END"
+        )
+        # Index the tasks that already exist.
+        op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_tasks_search_vector', table_name='tasks', postgresql_using='gin')
+        op.drop_column('tasks', 'search_vector')
+    elif dialect == 'sqlite':
+        for trigger in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
@@ -0,0 +1,34 @@
+"""cuarta migracion
+
+Revision ID: a3c9e1f27b4d
+Revises: 167f332803dd
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e1f27b4d'
+down_revision: Union[str, Sequence[str], None] = '167f332803dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_user_id_id', 'tasks', ['user_id', 'id'], unique=False)
+    op.create_index('ix_tasks_user_id_completed', 'tasks', ['user_id', 'completed'], unique=False)
+    op.create_index('ix_tasks_user_id_task_type', 'tasks', ['user_id', 'task_type'], unique=False)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index('ix_tasks_user_id_task_type', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_completed', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_id', table_name='tasks')
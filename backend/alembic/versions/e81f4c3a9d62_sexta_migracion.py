@@ -0,0 +1,47 @@
+"""sexta migracion
+
+Revision ID: e81f4c3a9d62
+Revises: 5b7e2d90c4a1
+Create Date: 2026-10-18 14:02:47.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from app.utils.ordering import key_between
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81f4c3a9d62'
+down_revision: Union[str, Sequence[str], None] = '5b7e2d90c4a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('position', sa.String(length=255), nullable=True))
+    # Existing tasks keep their creation order.
+    tasks = sa.table('tasks', sa.column('id', sa.Integer), sa.column('user_id', sa.Integer), sa.column('position', sa.String))
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(tasks.c.id, tasks.c.user_id).order_by(tasks.c.user_id, tasks.c.id)).all()
+    last_positions = {}
+    updates = []
+    for task_id, user_id in rows:
+        position = key_between(last_positions.get(user_id), None)
+        last_positions[user_id] = position
+        updates.append({'task_id': task_id, 'position': position})
+    if updates:
+        connection.execute(
+            tasks.update().where(tasks.c.id == sa.bindparam('task_id')).values(position=sa.bindparam('position')),
+            updates,
+        )
+    op.alter_column('tasks', 'position', existing_type=sa.String(length=255), nullable=False)
+    op.create_index('ix_tasks_user_id_position', 'tasks', ['user_id', 'position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_user_id_position', table_name='tasks')
+    op.drop_column('tasks', 'position')
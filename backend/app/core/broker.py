@@ -0,0 +1,252 @@
+import asyncio
+import json
+import logging
+import select as selectors
+import threading
+from typing import Dict, List, Optional, Set
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.core import events, metrics
+from app.core.config import settings
+from app.core.database import get_engine
+from app.core.lazy import once
+
+logger = logging.getLogger(__name__)
+
+STREAM_SUBSCRIBERS = metrics.gauge(
+  "task_stream_subscribers",
+  "Clients currently connected to the task change stream.",
+)
+STREAM_EVENTS = metrics.counter(
+  "task_stream_events_total",
+  "Task change events delivered to stream subscribers.",
+)
+STREAM_OVERFLOWS = metrics.counter(
+  "task_stream_overflows_total",
+  "Subscribers dropped because they could not keep up with their events.",
+)
+
+
+class Subscription:
+  """Queue of task events for one connected client.
+
+  Events are pushed from whatever thread committed the change and consumed on
+  the event loop that created the subscription. A client that falls more than
+  ``limit`` events behind receives ``None`` and must reload its list.
+  """
+
+  def __init__(self, user_id: int, limit: int):
+    self.user_id = user_id
+    self.limit = limit
+    self.loop = asyncio.get_running_loop()
+    self.overflowed = False
+    self._queue: asyncio.Queue = asyncio.Queue()
+
+  def _deliver(self, item: Optional[events.TaskEvent]) -> None:
+    if self.overflowed:
+      return
+    if item is not None and self._queue.qsize() >= self.limit:
+      self.overflowed = True
+      STREAM_OVERFLOWS.inc()
+      item = None
+    self._queue.put_nowait(item)
+
+  def push(self, item: Optional[events.TaskEvent]) -> None:
+    """Hand an event to the subscriber from any thread.
+
+    Args:
+      item (Optional[TaskEvent]): Event to deliver, None to ask for a reload.
+    """
+    try:
+      self.loop.call_soon_threadsafe(self._deliver, item)
+    except RuntimeError:
+      # The loop is closed, the stream is gone with it.
+      pass
+
+  async def get(self) -> Optional[events.TaskEvent]:
+    """Wait for the next event.
+
+    Returns:
+      Optional[TaskEvent]: Next event, None when the subscriber overflowed.
+    """
+    return await self._queue.get()
+
+
+class MemoryBackend:
+  """Deliver committed events to the subscribers of this process only.
+
+  Suitable for a single worker and for tests.
+  """
+
+  def attach(self, broker: "Broker") -> None:
+    events.add_listener(broker.dispatch)
+
+  def start(self) -> None:
+    pass
+
+  def close(self) -> None:
+    pass
+
+
+class PostgresBackend:
+  """Share committed events between workers through ``LISTEN``/``NOTIFY``.
+
+  Events are sent with ``pg_notify`` inside the writing transaction, so
+  Postgres only delivers them once it commits. A daemon thread keeps a
+  dedicated connection listening on the channel and feeds the local broker.
+  """
+
+  def __init__(self, engine, channel: str):
+    self.engine = engine
+    self.channel = channel
+    self._broker: Optional["Broker"] = None
+    self._thread: Optional[threading.Thread] = None
+    self._stopped = threading.Event()
+    self._lock = threading.Lock()
+    self._listened = False
+
+  def attach(self, broker: "Broker") -> None:
+    self._broker = broker
+    event.listen(Session, 'before_commit', self._notify)
+
+  def _notify(self, session: Session) -> None:
+    pending = events.pending_events(session)
+    if not pending:
+      return
+    session.execute(
+      text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+      {'channel': self.channel, 'payloads': [json.dumps(item) for item in pending]},
+    )
+
+  def start(self) -> None:
+    with self._lock:
+      if self._thread is not None:
+        return
+      self._thread = threading.Thread(target=self._listen, name='task-events-listener', daemon=True)
+      self._thread.start()
+
+  def _listen(self) -> None:
+    while not self._stopped.is_set():
+      try:
+        connection = self.engine.raw_connection()
+        connection.detach()
+        try:
+          self._consume(connection.driver_connection)
+        finally:
+          connection.close()
+      except Exception:
+        logger.exception("Task events listener lost its connection, reconnecting")
+        self._stopped.wait(1.0)
+
+  def _consume(self, dbapi_connection) -> None:
+    dbapi_connection.autocommit = True
+    with dbapi_connection.cursor() as cursor:
+      cursor.execute(f'LISTEN "{self.channel}"')
+    # Anything committed while the listener was down is lost, so every
+    # subscriber is asked to reload once the channel is live again.
+    if self._listened:
+      self._broker.reset_all()
+    self._listened = True
+    while not self._stopped.is_set():
+      if selectors.select([dbapi_connection], [], [], 5.0) == ([], [], []):
+        continue
+      dbapi_connection.poll()
+      received = []
+      while dbapi_connection.notifies:
+        received.append(json.loads(dbapi_connection.notifies.pop(0).payload))
+      if received:
+        self._broker.dispatch(received)
+
+  def close(self) -> None:
+    self._stopped.set()
+
+
+class Broker:
+  """Fan task events out to the stream subscribers of each user."""
+
+  def __init__(self, backend, queue_limit: int):
+    self.backend = backend
+    self.queue_limit = queue_limit
+    self._subscribers: Dict[int, Set[Subscription]] = {}
+    self._lock = threading.Lock()
+    backend.attach(self)
+    STREAM_SUBSCRIBERS.add_callback(lambda: {(): self.subscriber_count()})
+
+  def subscribe(self, user_id: int) -> Subscription:
+    """Start receiving the events of a user on the running event loop.
+
+    Args:
+      user_id (int): Identifier of the task owner.
+
+    Returns:
+      Subscription: Queue to read events from, release it with ``unsubscribe``.
+    """
+    self.backend.start()
+    subscription = Subscription(user_id, self.queue_limit)
+    with self._lock:
+      self._subscribers.setdefault(user_id, set()).add(subscription)
+    return subscription
+
+  def unsubscribe(self, subscription: Subscription) -> None:
+    """Stop delivering events to a subscription.
+
+    Args:
+      subscription (Subscription): Subscription returned by ``subscribe``.
+    """
+    with self._lock:
+      subscribers = self._subscribers.get(subscription.user_id)
+      if subscribers is None:
+        return
+      subscribers.discard(subscription)
+      if not subscribers:
+        del self._subscribers[subscription.user_id]
+
+  def dispatch(self, committed: List[events.TaskEvent]) -> None:
+    """Push committed events to the subscribers of their owners.
+
+    Args:
+      committed (List[TaskEvent]): Events in commit order.
+    """
+    with self._lock:
+      targets = [(item, list(self._subscribers.get(item['user_id'], ()))) for item in committed]
+    for item, subscribers in targets:
+      for subscription in subscribers:
+        subscription.push(item)
+        STREAM_EVENTS.inc()
+
+  def reset_all(self) -> None:
+    """Ask every subscriber to reload its list, used when events may have been lost."""
+    with self._lock:
+      subscribers = [subscription for group in self._subscribers.values() for subscription in group]
+    for subscription in subscribers:
+      subscription.push(None)
+
+  def subscriber_count(self) -> int:
+    with self._lock:
+      return sum(len(group) for group in self._subscribers.values())
+
+  def close(self) -> None:
+    self.backend.close()
+
+
+def build_backend():
+  """Instantiate the backend selected by ``EVENTS_BACKEND``.
+
+  Returns:
+    MemoryBackend | PostgresBackend: Backend the broker publishes through.
+  """
+  if settings.EVENTS_BACKEND == 'postgres':
+    return PostgresBackend(get_engine(), settings.EVENTS_CHANNEL)
+  if settings.EVENTS_BACKEND != 'memory':
+    raise ValueError(f'unknown EVENTS_BACKEND: {settings.EVENTS_BACKEND!r}')
+  return MemoryBackend()
+
+
+@once
+def get_broker() -> Broker:
+  """Build the broker on first use.
+
+  Returns:
+    Broker: Process wide broker, already attached to its backend.
+  """
+  return Broker(build_backend(), settings.EVENTS_QUEUE_LIMIT)
@@ -0,0 +1,261 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from app.core import events, metrics
+from app.core.config import settings
+from app.core.lazy import once
+
+TASK_CACHE_REQUESTS = metrics.counter(
+  "task_cache_requests_total",
+  "Task list lookups in the read-through cache.",
+  ["result"],
+)
+TASK_CACHE_EVICTIONS = metrics.counter(
+  "task_cache_evictions_total",
+  "Task lists dropped from the in-process cache to honour its size or TTL.",
+  ["reason"],
+)
+TASK_CACHE_INVALIDATIONS = metrics.counter(
+  "task_cache_invalidations_total",
+  "Users whose cached task lists were dropped after a committed write.",
+)
+TASK_CACHE_HIT_RATIO = metrics.gauge(
+  "task_cache_hit_ratio",
+  "Share of task list lookups answered from the cache since start.",
+)
+TASK_CACHE_ENTRIES = metrics.gauge(
+  "task_cache_entries",
+  "Task lists currently held by the in-process cache.",
+)
+
+
+def _hit_ratio() -> Dict[Tuple[str, ...], float]:
+  hits = TASK_CACHE_REQUESTS.value(result='hit')
+  total = hits + TASK_CACHE_REQUESTS.value(result='miss')
+  return {(): hits / total if total else 0.0}
+
+
+TASK_CACHE_HIT_RATIO.add_callback(_hit_ratio)
+
+
+class MemoryCache:
+  """Bounded LRU of serialized task lists, each kept at most ``ttl`` seconds.
+
+  Entries are grouped by user so a write drops every page and filter of that
+  user at once.
+  """
+
+  def __init__(self, maxsize: int, ttl: float):
+    self.maxsize = maxsize
+    self.ttl = ttl
+    self._entries: OrderedDict = OrderedDict()
+    self._by_user: Dict[int, Set[Tuple[int, str]]] = {}
+    self._lock = threading.Lock()
+    TASK_CACHE_ENTRIES.add_callback(lambda: {(): len(self._entries)})
+
+  def _drop(self, key: Tuple[int, str]) -> None:
+    del self._entries[key]
+    keys = self._by_user[key[0]]
+    keys.discard(key)
+    if not keys:
+      del self._by_user[key[0]]
+
+  def get(self, user_id: int, field: str) -> Optional[bytes]:
+    key = (user_id, field)
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      if entry[1] <= time.monotonic():
+        self._drop(key)
+        TASK_CACHE_EVICTIONS.inc(reason='ttl')
+        return None
+      self._entries.move_to_end(key)
+      return entry[0]
+
+  def set(self, user_id: int, field: str, value: bytes) -> None:
+    if self.maxsize <= 0:
+      return
+    key = (user_id, field)
+    with self._lock:
+      self._entries[key] = (value, time.monotonic() + self.ttl)
+      self._entries.move_to_end(key)
+      self._by_user.setdefault(user_id, set()).add(key)
+      while len(self._entries) > self.maxsize:
+        self._drop(next(iter(self._entries)))
+        TASK_CACHE_EVICTIONS.inc(reason='size')
+
+  def invalidate(self, user_ids: Iterable[int]) -> None:
+    with self._lock:
+      for user_id in user_ids:
+        for key in self._by_user.pop(user_id, ()):
+          del self._entries[key]
+
+
+class RedisCache:
+  """Task lists kept in a Redis-compatible server, one hash per user.
+
+  Each page or filter is a field of the user's hash, so invalidating a user
+  is a single ``DEL``. Size bounds and evictions are left to the server's
+  ``maxmemory`` policy.
+  """
+
+  def __init__(self, client, ttl: float, prefix: str = 'tasks'):
+    self.client = client
+    self.ttl = int(ttl)
+    self.prefix = prefix
+
+  def _key(self, user_id: int) -> str:
+    return f'{self.prefix}:{user_id}'
+
+  def get(self, user_id: int, field: str) -> Optional[bytes]:
+    return self.client.hget(self._key(user_id), field)
+
+  def set(self, user_id: int, field: str, value: bytes) -> None:
+    key = self._key(user_id)
+    self.client.hset(key, field, value)
+    self.client.expire(key, self.ttl)
+
+  def invalidate(self, user_ids: Iterable[int]) -> None:
+    keys = [self._key(user_id) for user_id in user_ids]
+    if keys:
+      self.client.delete(*keys)
+
+
+class FakeRedis:
+  """In-process stand-in for the few Redis commands ``RedisCache`` sends.
+
+  Selected with ``CACHE_REDIS_URL=fake://`` to exercise the Redis code path
+  without a server.
+  """
+
+  def __init__(self):
+    self._hashes: Dict[str, Dict[str, bytes]] = {}
+    self._expires: Dict[str, float] = {}
+    self._lock = threading.Lock()
+
+  def _live(self, key: str) -> Optional[Dict[str, bytes]]:
+    if self._expires.get(key, float('inf')) <= time.monotonic():
+      self._hashes.pop(key, None)
+      self._expires.pop(key, None)
+    return self._hashes.get(key)
+
+  def hget(self, key: str, field: str) -> Optional[bytes]:
+    with self._lock:
+      values = self._live(key)
+      return values.get(field) if values is not None else None
+
+  def hset(self, key: str, field: str, value: bytes) -> int:
+    with self._lock:
+      values = self._live(key)
+      if values is None:
+        values = self._hashes[key] = {}
+      created = field not in values
+      values[field] = value
+      return int(created)
+
+  def expire(self, key: str, seconds: int) -> bool:
+    with self._lock:
+      if self._live(key) is None:
+        return False
+      self._expires[key] = time.monotonic() + seconds
+      return True
+
+  def delete(self, *keys: str) -> int:
+    with self._lock:
+      removed = 0
+      for key in keys:
+        removed += self._live(key) is not None
+        self._hashes.pop(key, None)
+        self._expires.pop(key, None)
+      return removed
+
+
+class TaskListCache:
+  """Read-through cache of serialized task pages, keyed by user and query.
+
+  Stored pages are tagged with the task revision they were built from and
+  only served for that same revision, so a page rendered from a snapshot
+  that raced with a write can never be returned. Committed writes also drop
+  the user's pages right away to free the space.
+  """
+
+  def __init__(self, backend):
+    self.backend = backend
+
+  def get(self, user_id: int, revision: int, query: str) -> Optional[bytes]:
+    """Return the cached page for the current revision of a user.
+
+    Args:
+      user_id (int): Identifier of the task owner.
+      revision (int): Current task revision of the owner.
+      query (str): Raw query string identifying the page and filters.
+
+    Returns:
+      Optional[bytes]: Serialized ``TaskPage``, None on a miss.
+    """
+    if self.backend is None:
+      return None
+    stored = self.backend.get(user_id, query)
+    tag = f'{revision}:'.encode()
+    if stored is not None and stored.startswith(tag):
+      TASK_CACHE_REQUESTS.inc(result='hit')
+      return stored[len(tag):]
+    TASK_CACHE_REQUESTS.inc(result='miss')
+    return None
+
+  def set(self, user_id: int, revision: int, query: str, page: bytes) -> None:
+    """Store a serialized page built at a given revision.
+
+    Args:
+      user_id (int): Identifier of the task owner.
+      revision (int): Task revision the page was read at.
+      query (str): Raw query string identifying the page and filters.
+      page (bytes): Serialized ``TaskPage``.
+    """
+    if self.backend is not None:
+      self.backend.set(user_id, query, f'{revision}:'.encode() + page)
+
+  def invalidate(self, committed: List[events.TaskEvent]) -> None:
+    """Drop the pages of every user touched by a committed transaction.
+
+    Args:
+      committed (List[TaskEvent]): Events published by the transaction.
+    """
+    if self.backend is None:
+      return
+    user_ids = {event['user_id'] for event in committed}
+    self.backend.invalidate(user_ids)
+    TASK_CACHE_INVALIDATIONS.inc(len(user_ids))
+
+
+def build_backend():
+  """Instantiate the backend selected by ``CACHE_BACKEND``.
+
+  Returns:
+    MemoryCache | RedisCache | None: Storage for the task lists, None when caching is off.
+  """
+  if settings.CACHE_BACKEND == 'none':
+    return None
+  if settings.CACHE_BACKEND == 'memory':
+    return MemoryCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+  if settings.CACHE_BACKEND != 'redis':
+    raise ValueError(f'unknown CACHE_BACKEND: {settings.CACHE_BACKEND!r}')
+  if settings.CACHE_REDIS_URL.startswith('fake://'):
+    return RedisCache(FakeRedis(), settings.CACHE_TTL_SECONDS)
+  # redis is only required by this backend, so it is not a hard dependency.
+  import redis
+  return RedisCache(redis.Redis.from_url(settings.CACHE_REDIS_URL), settings.CACHE_TTL_SECONDS)
+
+
+@once
+def get_task_list_cache() -> TaskListCache:
+  """Build the task list cache on first use and subscribe it to committed writes.
+
+  Returns:
+    TaskListCache: Process wide cache.
+  """
+  cache = TaskListCache(build_backend())
+  events.add_listener(cache.invalidate)
+  return cache
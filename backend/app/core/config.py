@@ -1,11 +1,52 @@
 from pydantic import field_validator
-from pydantic_settings import BaseSettings
-from typing import List
+from pydantic_settings import BaseSettings, NoDecode
+from typing import Annotated, List, Optional
+from app.core.lazy import once
 
 class Settings(BaseSettings):
   """Application configuration sourced from environment variables."""
 
   DATABASE_URL: str
+  ASYNC_DATABASE_URL: Optional[str] = None
+  DATABASE_REPLICA_URLS: Annotated[List[str], NoDecode] = []
+  ASYNC_DATABASE_REPLICA_URLS: Annotated[List[str], NoDecode] = []
+  DB_POOL_SIZE: int = 5
+  DB_MAX_OVERFLOW: int = 10
+  DB_POOL_TIMEOUT: float = 30.0
+  DB_POOL_RECYCLE: int = 1800
+  DB_POOL_PRE_PING: bool = True
+  BCRYPT_ROUNDS: int = 12
+  HASH_WORKERS: int = 4
+  HASH_QUEUE_LIMIT: int = 32
+  TOKEN_CACHE_SIZE: int = 10000
+  EVENTS_BACKEND: str = "memory"
+  EVENTS_CHANNEL: str = "task_events"
+  EVENTS_QUEUE_LIMIT: int = 256
+  EVENTS_HEARTBEAT_SECONDS: float = 15.0
+  CACHE_BACKEND: str = "memory"
+  CACHE_MAX_ENTRIES: int = 10000
+  CACHE_TTL_SECONDS: float = 300.0
+  CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+  TASK_JSON_FAST_PATH: bool = False
+  IMPORT_BATCH_SIZE: int = 5000
+  REQUEST_PROFILING: bool = True
+  N_PLUS_ONE_THRESHOLD: int = 10
+  SERVER_BIND: str = "0.0.0.0:8000"
+  SERVER_WORKERS: int = 0
+  SERVER_BACKLOG: int = 2048
+  SERVER_KEEPALIVE: int = 5
+  SERVER_GRACEFUL_TIMEOUT: int = 30
+  SERVER_TIMEOUT: int = 30
+  SERVER_MAX_REQUESTS: int = 0
+  RATE_LIMIT_ENABLED: bool = True
+  RATE_LIMIT_BACKEND: str = "memory"
+  RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+  RATE_LIMIT_IP_BURST: int = 20
+  RATE_LIMIT_IP_PER_MINUTE: float = 30.0
+  RATE_LIMIT_ACCOUNT_BURST: int = 5
+  RATE_LIMIT_ACCOUNT_PER_MINUTE: float = 5.0
+  RATE_LIMIT_SHARDS: int = 16
+  RATE_LIMIT_MAX_KEYS: int = 100000
   BACKEND_CORS_ORIGINS: List[str] = []
   SECRET_KEY: str
   ALGORITHM: str
@@ -23,9 +64,38 @@ class Settings(BaseSettings):
     if isinstance(v, str):
         return [i.strip() for i in v.split(",") if i.strip()]
     return v
+
+  @field_validator("DATABASE_REPLICA_URLS", "ASYNC_DATABASE_REPLICA_URLS", mode="before")
+  def split_urls(cls, v):
+    """Split the comma separated replica URLs, an empty value meaning none.
+
+    Args:
+      v (str | List[str]): Comma separated database URLs or a list of them.
+
+    Returns:
+      List[str]: One URL per replica.
+    """
+    if isinstance(v, str):
+      return [url.strip() for url in v.split(",") if url.strip()]
+    return v
   
   class Config:
     """Enable loading values from the dotenv file."""
     env_file =".env"
 
-settings = Settings()
+@once
+def get_settings() -> Settings:
+  """Read the configuration the first time it is needed.
+
+  Returns:
+    Settings: Process wide configuration.
+  """
+  return Settings()
+
+class LazySettings:
+  """Proxy to ``get_settings()`` so importing a module never reads the environment."""
+
+  def __getattr__(self, name: str):
+    return getattr(get_settings(), name)
+
+settings = LazySettings()
@@ -1,19 +1,167 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import itertools
+from typing import List, Optional
+from fastapi import Request
+from sqlalchemy import CompoundSelect, Engine, Select, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.core.config import settings
+from app.core.lazy import once
+from app.core.pool import engine_options, instrument_engine
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
-def get_db():
+
+@once
+def get_engine() -> Engine:
+  """Create the primary engine on first use.
+
+  Returns:
+    Engine: Engine bound to ``DATABASE_URL``.
+  """
+  engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL, "primary"))
+  instrument_engine(engine, "primary")
+  return engine
+
+
+@once
+def get_async_engine() -> Optional[AsyncEngine]:
+  """Create the opt-in async engine on first use.
+
+  asyncpg on Postgres, aiosqlite for local runs; without
+  ``ASYNC_DATABASE_URL`` every route stays on the synchronous engine.
+
+  Returns:
+    Optional[AsyncEngine]: Engine bound to ``ASYNC_DATABASE_URL``, None when unset.
+  """
+  if not settings.ASYNC_DATABASE_URL:
+    return None
+  engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    **engine_options(settings.ASYNC_DATABASE_URL, "async", is_async=True),
+  )
+  instrument_engine(engine.sync_engine, "async")
+  return engine
+
+
+@once
+def get_replica_engines() -> List[Engine]:
+  """Create one engine per ``DATABASE_REPLICA_URLS`` entry on first use.
+
+  Returns:
+    List[Engine]: Read replica engines, empty when none are configured.
+  """
+  engines = []
+  for index, url in enumerate(settings.DATABASE_REPLICA_URLS):
+    engine = create_engine(url, **engine_options(url, f"replica-{index}"))
+    instrument_engine(engine, f"replica-{index}")
+    engines.append(engine)
+  return engines
+
+
+@once
+def get_async_replica_engines() -> List[AsyncEngine]:
+  """Create one async engine per ``ASYNC_DATABASE_REPLICA_URLS`` entry on first use.
+
+  Returns:
+    List[AsyncEngine]: Async read replica engines, empty when none are configured.
+  """
+  engines = []
+  for index, url in enumerate(settings.ASYNC_DATABASE_REPLICA_URLS):
+    engine = create_async_engine(url, **engine_options(url, f"async-replica-{index}", is_async=True))
+    instrument_engine(engine.sync_engine, f"async-replica-{index}")
+    engines.append(engine)
+  return engines
+
+
+# Keys of ``Session.info`` holding the routing decision of a session.
+USE_PRIMARY = 'use_primary'
+REPLICA = 'replica'
+READ_METHODS = {'GET', 'HEAD'}
+
+_replica_turns = itertools.count()
+
+
+def _is_plain_read(clause) -> bool:
+  return isinstance(clause, (Select, CompoundSelect)) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+  """Session sending plain reads to a replica and everything else to the primary.
+
+  Until it writes, a session reads from one replica, taken round-robin the
+  first time it needs one and kept for its lifetime so all its reads see the
+  same replica. A flush, a DML statement, a ``FOR UPDATE`` select or raw SQL
+  pins it to the primary for good, so whatever it reads afterwards includes
+  its own writes. ``info['use_primary']`` pins it up front. Without replicas
+  everything goes to the primary.
+  """
+
+  def primary_engine(self) -> Engine:
+    return get_engine()
+
+  def replica_engines(self) -> List[Engine]:
+    return get_replica_engines()
+
+  def get_bind(self, mapper=None, clause=None, **kwargs):
+    if self.bind is not None:
+      return super().get_bind(mapper, clause=clause, **kwargs)
+    if clause is None and not self._flushing:
+      # Dialect lookups and ``Session.connection()``, nothing to route yet.
+      return self.primary_engine()
+    replicas = self.replica_engines()
+    if not replicas or self.info.get(USE_PRIMARY) or self._flushing or not _is_plain_read(clause):
+      self.info[USE_PRIMARY] = True
+      return self.primary_engine()
+    if REPLICA not in self.info:
+      self.info[REPLICA] = next(_replica_turns) % len(replicas)
+    return replicas[self.info[REPLICA]]
+
+
+class AsyncRoutingSession(RoutingSession):
+  """Synchronous half of ``AsyncSessionLocal`` sessions, routed over the async engines."""
+
+  def primary_engine(self) -> Engine:
+    return get_async_engine().sync_engine
+
+  def replica_engines(self) -> List[Engine]:
+    return [engine.sync_engine for engine in get_async_replica_engines()]
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, autoflush=False, autocommit=False)
+AsyncSessionLocal = async_sessionmaker(
+  sync_session_class=AsyncRoutingSession,
+  autoflush=False,
+  expire_on_commit=False,
+)
+
+def get_db(request: Request):
   """Provide a SQLAlchemy session for the lifespan of a request.
 
+  Sessions of requests other than GET and HEAD stay on the primary, so the
+  checks a write makes before writing never read a lagging replica.
+
+  Args:
+    request (Request): Incoming request, used to tell reads from writes.
+
   Yields:
-    Session: Database session bound to the configured engine.
+    Session: Database session routed over the primary and its replicas.
   """
-  db = SessionLocal()
+  db = SessionLocal(info={USE_PRIMARY: request.method not in READ_METHODS})
   try:
     yield db
   finally:
     db.close()
+
+async def get_async_db(request: Request):
+  """Provide an async SQLAlchemy session for the lifespan of a request.
+
+  Routed like ``get_db``.
+
+  Args:
+    request (Request): Incoming request, used to tell reads from writes.
+
+  Yields:
+    AsyncSession: Database session routed over the async primary and its replicas.
+  """
+  async with AsyncSessionLocal(info={USE_PRIMARY: request.method not in READ_METHODS}) as db:
+    yield db
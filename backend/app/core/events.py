@@ -0,0 +1,73 @@
+import logging
+from typing import Callable, List
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Task changes are collected on the session while the transaction is open and
+# only handed to the listeners once it commits, so a rolled back write never
+# reaches a subscriber.
+_PENDING_KEY = 'task_events'
+
+TaskEvent = dict
+Listener = Callable[[List[TaskEvent]], None]
+
+_listeners: List[Listener] = []
+
+
+def record_event(db: Session, user_id: int, event_type: str, revision: int, **data) -> None:
+  """Queue a task change to be published when the current transaction commits.
+
+  Args:
+    db (Session): Session running the write.
+    user_id (int): Owner of the changed task.
+    event_type (str): One of created, updated or deleted.
+    revision (int): Task revision of the owner after the change.
+    **data: Event body, ``task`` for created and updated, ``id`` for deleted.
+  """
+  db.info.setdefault(_PENDING_KEY, []).append({
+    'user_id': user_id,
+    'type': event_type,
+    'revision': revision,
+    **data,
+  })
+
+
+def pending_events(db: Session) -> List[TaskEvent]:
+  """Return the events recorded in the transaction that is still open.
+
+  Args:
+    db (Session): Session running the write.
+
+  Returns:
+    List[TaskEvent]: Events waiting for the commit.
+  """
+  return db.info.get(_PENDING_KEY, [])
+
+
+def add_listener(listener: Listener) -> None:
+  """Register a callable invoked with the events of every committed transaction.
+
+  Args:
+    listener (Listener): Receives the list of events, in the order they were recorded.
+  """
+  _listeners.append(listener)
+
+
+@event.listens_for(Session, 'after_commit')
+def _dispatch(session: Session) -> None:
+  events = session.info.pop(_PENDING_KEY, None)
+  if not events:
+    return
+  for listener in _listeners:
+    try:
+      listener(events)
+    except Exception:
+      logger.exception("Task event listener %r failed", listener)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard(session: Session, transaction) -> None:
+  if transaction.parent is None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,31 @@
+import threading
+from functools import wraps
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def once(build: Callable[[], T]) -> Callable[[], T]:
+  """Turn a factory into a getter that builds its object on the first call only.
+
+  Unlike ``functools.lru_cache``, concurrent first calls wait for the one
+  that is building instead of each creating their own engine, pool or thread.
+
+  Args:
+    build (Callable[[], T]): Factory without arguments.
+
+  Returns:
+    Callable[[], T]: Getter returning the same object on every call.
+  """
+  lock = threading.Lock()
+  built = []
+
+  @wraps(build)
+  def get() -> T:
+    if not built:
+      with lock:
+        if not built:
+          built.append(build())
+    return built[0]
+
+  return get
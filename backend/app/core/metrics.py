@@ -0,0 +1,198 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+  """Escape a label value as required by the exposition format."""
+  return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: Iterable[str], values: LabelValues, extra: Optional[Dict[str, str]] = None) -> str:
+  """Render a label set in the Prometheus exposition format.
+
+  Args:
+    labelnames (Iterable[str]): Names declared by the metric.
+    values (LabelValues): Values matching ``labelnames``.
+    extra (Optional[Dict[str, str]]): Additional labels such as histogram ``le``.
+
+  Returns:
+    str: ``{a="1",b="2"}`` or an empty string when there are no labels.
+  """
+  pairs = list(zip(labelnames, values)) + list((extra or {}).items())
+  if not pairs:
+    return ""
+  body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+  return "{" + body + "}"
+
+
+class _Metric(ABC):
+  """Base class holding the metadata shared by every metric type."""
+
+  kind = "untyped"
+
+  def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+    self.name = name
+    self.documentation = documentation
+    self.labelnames = tuple(labelnames)
+    self._lock = threading.Lock()
+
+  def _key(self, labels: Dict[str, str]) -> LabelValues:
+    return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+  def header(self) -> List[str]:
+    return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+  @abstractmethod
+  def samples(self) -> List[str]:
+    """Render the current readings, one exposition line each."""
+
+
+class Counter(_Metric):
+  """Monotonically increasing value, optionally split by labels."""
+
+  kind = "counter"
+
+  def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+    super().__init__(name, documentation, labelnames)
+    self._values: Dict[LabelValues, float] = {}
+
+  def inc(self, amount: float = 1, **labels) -> None:
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = self._values.get(key, 0) + amount
+
+  def value(self, **labels) -> float:
+    return self._values.get(self._key(labels), 0)
+
+  def samples(self) -> List[str]:
+    with self._lock:
+      items = list(self._values.items())
+    return [f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in items]
+
+
+class Gauge(_Metric):
+  """Point in time value, either set explicitly or read from a callback.
+
+  The callback returns a mapping of label values to readings and is invoked
+  on every scrape, which suits values owned by another object (a pool, a cache).
+  """
+
+  kind = "gauge"
+
+  def __init__(
+    self,
+    name: str,
+    documentation: str,
+    labelnames: Iterable[str] = (),
+    callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+  ):
+    super().__init__(name, documentation, labelnames)
+    self._values: Dict[LabelValues, float] = {}
+    self._callbacks: List[Callable[[], Dict[LabelValues, float]]] = [callback] if callback else []
+
+  def add_callback(self, callback: Callable[[], Dict[LabelValues, float]]) -> None:
+    self._callbacks.append(callback)
+
+  def set(self, value: float, **labels) -> None:
+    with self._lock:
+      self._values[self._key(labels)] = value
+
+  def samples(self) -> List[str]:
+    with self._lock:
+      values = dict(self._values)
+    for callback in self._callbacks:
+      values.update(callback())
+    return [f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in values.items()]
+
+
+class Histogram(_Metric):
+  """Cumulative bucketed distribution of observations."""
+
+  kind = "histogram"
+
+  def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+    super().__init__(name, documentation, labelnames)
+    self.buckets = tuple(sorted(buckets))
+    self._series: Dict[LabelValues, list] = {}
+
+  def observe(self, value: float, **labels) -> None:
+    key = self._key(labels)
+    with self._lock:
+      series = self._series.get(key)
+      if series is None:
+        series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+      for index, bound in enumerate(self.buckets):
+        if value <= bound:
+          series[0][index] += 1
+          break
+      series[1] += value
+      series[2] += 1
+
+  def samples(self) -> List[str]:
+    lines = []
+    with self._lock:
+      items = [(key, (list(s[0]), s[1], s[2])) for key, s in self._series.items()]
+    for key, (counts, total, count) in items:
+      cumulative = 0
+      for bound, bucket_count in zip(self.buckets, counts):
+        cumulative += bucket_count
+        lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, {'le': bound})} {cumulative}")
+      lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, {'le': '+Inf'})} {count}")
+      lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+      lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+    return lines
+
+
+class Registry:
+  """Collection of metrics rendered together by the ``/metrics`` endpoint."""
+
+  def __init__(self):
+    self._metrics: Dict[str, _Metric] = {}
+    self._lock = threading.Lock()
+
+  def register(self, metric: _Metric) -> _Metric:
+    """Add a metric, returning the existing one when the name is taken.
+
+    Args:
+      metric (_Metric): Metric to expose.
+
+    Returns:
+      _Metric: Registered metric instance.
+    """
+    with self._lock:
+      return self._metrics.setdefault(metric.name, metric)
+
+  def render(self) -> str:
+    """Serialize every registered metric in the Prometheus text format.
+
+    Returns:
+      str: Exposition payload terminated by a newline.
+    """
+    lines = []
+    for metric in list(self._metrics.values()):
+      lines.extend(metric.header())
+      lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+  """Create or fetch a counter from the global registry."""
+  return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Iterable[str] = (), callback=None) -> Gauge:
+  """Create or fetch a gauge from the global registry."""
+  return REGISTRY.register(Gauge(name, documentation, labelnames, callback))
+
+
+def histogram(name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+  """Create or fetch a histogram from the global registry."""
+  return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
@@ -0,0 +1,149 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core import metrics
+from app.core.config import settings
+
+POOL_WAIT_SECONDS = metrics.histogram(
+  "db_pool_wait_seconds",
+  "Time spent waiting to check a connection out of the pool.",
+  ["engine"],
+  buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+POOL_TIMEOUTS = metrics.counter(
+  "db_pool_timeouts_total",
+  "Checkouts that gave up after DB_POOL_TIMEOUT seconds.",
+  ["engine"],
+)
+POOL_CONNECTS = metrics.counter(
+  "db_pool_connects_total",
+  "New DBAPI connections opened by the pool.",
+  ["engine"],
+)
+POOL_INVALIDATIONS = metrics.counter(
+  "db_pool_invalidations_total",
+  "Connections discarded by pre-ping or after an error.",
+  ["engine"],
+)
+STATEMENT_SECONDS = metrics.histogram(
+  "db_statement_duration_seconds",
+  "Time from sending a statement to the database to getting its cursor back.",
+  ["engine"],
+)
+POOL_CHECKED_OUT = metrics.gauge(
+  "db_pool_checked_out",
+  "Connections currently lent to requests.",
+  ["engine"],
+)
+POOL_IDLE = metrics.gauge(
+  "db_pool_idle",
+  "Connections sitting idle in the pool.",
+  ["engine"],
+)
+POOL_OVERFLOW = metrics.gauge(
+  "db_pool_overflow",
+  "Connections opened beyond DB_POOL_SIZE.",
+  ["engine"],
+)
+
+
+class _TimedCheckoutMixin:
+  """Record how long each checkout waits on the pool queue.
+
+  The engine label is taken from ``pool_logging_name``, which survives the
+  pool being recreated by ``engine.dispose()``.
+  """
+
+  def _do_get(self):
+    start = time.perf_counter()
+    try:
+      return super()._do_get()
+    except PoolTimeoutError:
+      POOL_TIMEOUTS.inc(engine=self._orig_logging_name)
+      raise
+    finally:
+      POOL_WAIT_SECONDS.observe(time.perf_counter() - start, engine=self._orig_logging_name)
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+  """QueuePool that reports checkout wait times."""
+
+
+class InstrumentedAsyncPool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+  """Async adapted QueuePool that reports checkout wait times."""
+
+
+def engine_options(url: str, name: str, is_async: bool = False) -> dict:
+  """Build the pool keyword arguments for ``create_engine`` from ``Settings``.
+
+  In-memory SQLite keeps SQLAlchemy's default single connection pool, since
+  sizing options do not apply to it.
+
+  Args:
+    url (str): Database URL the engine will connect to.
+    name (str): Label identifying the engine in the pool metrics.
+    is_async (bool): Whether the engine is created with ``create_async_engine``.
+
+  Returns:
+    dict: Keyword arguments for the engine factory.
+  """
+  parsed = make_url(url)
+  if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+    return {}
+  return {
+    "poolclass": InstrumentedAsyncPool if is_async else InstrumentedQueuePool,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "pool_logging_name": name,
+  }
+
+
+def instrument_engine(engine, name: str) -> None:
+  """Publish the pool occupancy and statement latency of an engine through the metrics registry.
+
+  Args:
+    engine (Engine): Synchronous engine, or the ``sync_engine`` of an async one.
+    name (str): Label identifying the engine in the pool and statement metrics.
+  """
+  def read(getter):
+    def collect():
+      pool = engine.pool
+      if not isinstance(pool, QueuePool):
+        return {}
+      return {(name,): getter(pool)}
+    return collect
+
+  POOL_CHECKED_OUT.add_callback(read(lambda pool: pool.checkedout()))
+  POOL_IDLE.add_callback(read(lambda pool: pool.checkedin()))
+  # QueuePool counts overflow from -pool_size, only the surplus is reported.
+  POOL_OVERFLOW.add_callback(read(lambda pool: max(pool.overflow(), 0)))
+
+  @event.listens_for(engine, "connect")
+  def on_connect(dbapi_connection, connection_record):
+    POOL_CONNECTS.inc(engine=name)
+
+  @event.listens_for(engine, "invalidate")
+  def on_invalidate(dbapi_connection, connection_record, exception):
+    POOL_INVALIDATIONS.inc(engine=name)
+
+  @event.listens_for(engine, "before_cursor_execute")
+  def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('statement_started', []).append(time.perf_counter())
+
+  @event.listens_for(engine, "after_cursor_execute")
+  def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('statement_started')
+    if started:
+      STATEMENT_SECONDS.observe(time.perf_counter() - started.pop(), engine=name)
+
+  @event.listens_for(engine, "handle_error")
+  def on_error(exception_context):
+    # A failed statement never reaches after_cursor_execute.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('statement_started'):
+      connection.info['statement_started'].pop()
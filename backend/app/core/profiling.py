@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+REQUEST_SECONDS = metrics.histogram(
+  "http_request_duration_seconds",
+  "Time from receiving a request to sending the last byte of its response.",
+  ["method", "route", "status"],
+)
+REQUEST_SQL_STATEMENTS = metrics.histogram(
+  "http_request_sql_statements",
+  "SQL statements executed while serving a request.",
+  ["route"],
+  buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500),
+)
+REQUEST_SQL_SECONDS = metrics.histogram(
+  "http_request_sql_seconds",
+  "Time spent executing SQL statements while serving a request.",
+  ["route"],
+)
+N_PLUS_ONE = metrics.counter(
+  "http_request_n_plus_one_total",
+  "Requests that ran the same SELECT at least N_PLUS_ONE_THRESHOLD times.",
+  ["route"],
+)
+
+_current: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+
+
+class RequestProfile:
+  """SQL activity of one request, filled from whatever thread runs its queries.
+
+  Sync endpoints run on the threadpool and async ones through greenlets, both
+  of which inherit the request's context, so the profile is reached through a
+  context variable instead of being passed around.
+  """
+
+  def __init__(self):
+    self.started = time.perf_counter()
+    self.statements = 0
+    self.sql_seconds = 0.0
+    self.selects: Counter = Counter()
+    self._lock = threading.Lock()
+
+  def record(self, statement: str, seconds: float) -> None:
+    with self._lock:
+      self.statements += 1
+      self.sql_seconds += seconds
+      if statement.lstrip()[:6].upper() == 'SELECT':
+        self.selects[statement] += 1
+
+  def repeated(self, threshold: int) -> Optional[tuple]:
+    """Return the most repeated SELECT when it reached the threshold.
+
+    Args:
+      threshold (int): Executions of one statement that count as an N+1 pattern.
+
+    Returns:
+      Optional[tuple]: Statement text and executions, None below the threshold.
+    """
+    with self._lock:
+      if not self.selects:
+        return None
+      statement, count = self.selects.most_common(1)[0]
+    return (statement, count) if count >= threshold else None
+
+  def server_timing(self) -> str:
+    """Render the request so far as a ``Server-Timing`` header value.
+
+    Returns:
+      str: ``app`` and ``db`` metrics with their durations in milliseconds.
+    """
+    elapsed = (time.perf_counter() - self.started) * 1000
+    with self._lock:
+      statements, sql = self.statements, self.sql_seconds * 1000
+    return f'app;dur={elapsed:.1f}, db;desc="{statements} queries";dur={sql:.1f}'
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+  if _current.get() is not None:
+    conn.info.setdefault('profile_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+  profile = _current.get()
+  started = conn.info.get('profile_started')
+  if profile is not None and started:
+    profile.record(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+  # A failed statement never reaches after_cursor_execute.
+  connection = exception_context.connection
+  if connection is not None and connection.info.get('profile_started'):
+    connection.info['profile_started'].pop()
+
+
+class ProfilingMiddleware:
+  """Time each request and the SQL it runs.
+
+  Adds a ``Server-Timing`` header with the elapsed time and the SQL count and
+  time up to the response start, records per route histograms once the body
+  is sent, and warns when one SELECT repeats often enough to suggest an N+1
+  query pattern. Routes are labelled by their path template.
+  """
+
+  def __init__(self, app, n_plus_one_threshold: int = 10):
+    self.app = app
+    self.n_plus_one_threshold = n_plus_one_threshold
+
+  async def __call__(self, scope, receive, send):
+    if scope["type"] != "http":
+      await self.app(scope, receive, send)
+      return
+    profile = RequestProfile()
+    token = _current.set(profile)
+    status = 500
+
+    async def send_with_timing(message):
+      nonlocal status
+      if message["type"] == "http.response.start":
+        status = message["status"]
+        MutableHeaders(scope=message).append("Server-Timing", profile.server_timing())
+      await send(message)
+
+    try:
+      await self.app(scope, receive, send_with_timing)
+    finally:
+      _current.reset(token)
+      self._observe(scope, status, profile)
+
+  def _observe(self, scope, status: int, profile: RequestProfile) -> None:
+    route = getattr(scope.get("route"), "path", None) or "unmatched"
+    REQUEST_SECONDS.observe(time.perf_counter() - profile.started, method=scope["method"], route=route, status=status)
+    REQUEST_SQL_STATEMENTS.observe(profile.statements, route=route)
+    REQUEST_SQL_SECONDS.observe(profile.sql_seconds, route=route)
+    repeated = profile.repeated(self.n_plus_one_threshold)
+    if repeated is not None:
+      N_PLUS_ONE.inc(route=route)
+      statement, count = repeated
+      logger.warning(
+        "Possible N+1 query on %s %s: statement ran %d times: %s",
+        scope["method"], route, count, " ".join(statement.split())[:200],
+      )
+
@@ -0,0 +1,316 @@
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from app.core import metrics
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_REJECTIONS = metrics.counter(
+  "rate_limit_rejections_total",
+  "Requests answered with 429 because their token bucket was empty.",
+  ["bucket"],
+)
+RATE_LIMIT_ERRORS = metrics.counter(
+  "rate_limit_backend_errors_total",
+  "Bucket checks that failed and let the request through.",
+)
+
+# Throttled endpoints and the body field naming the account they act on.
+ACCOUNT_FIELDS = {
+  '/auth/token': 'username',
+  '/auth/create': 'email',
+}
+# Credentials fit in far less; anything bigger is refused before it is buffered.
+MAX_BODY_BYTES = 16 * 1024
+
+# Refill and take in one step on the server, with the server's clock, so
+# workers never overwrite each other's updates. The wait is returned as a
+# string because Redis truncates Lua numbers to integers.
+TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'stamp')
+local tokens = tonumber(state[1]) or capacity
+local stamp = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - stamp) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'stamp', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+def _take(tokens: float, elapsed: float, capacity: float, rate: float) -> Tuple[float, float]:
+  """Refill a bucket for the time elapsed and try to take one token from it.
+
+  Args:
+    tokens (float): Tokens left at the last check.
+    elapsed (float): Seconds since the last check.
+    capacity (float): Maximum tokens, the allowed burst.
+    rate (float): Tokens added per second.
+
+  Returns:
+    Tuple[float, float]: Tokens left and seconds to wait, 0 when the token was taken.
+  """
+  tokens = min(capacity, tokens + max(0.0, elapsed) * rate)
+  if tokens >= 1:
+    return tokens - 1, 0.0
+  return tokens, (1 - tokens) / rate
+
+
+class MemoryBuckets:
+  """Token buckets of this process, spread over independently locked shards.
+
+  A check locks one shard and does a dict lookup, the refill arithmetic and
+  an LRU bump. Each shard keeps at most ``max_keys / shards`` buckets and
+  forgets the least recently seen one beyond that, which at worst hands an
+  idle client a full bucket again. Limits apply per worker.
+  """
+
+  blocking = False
+
+  def __init__(self, shards: int, max_keys: int, clock=time.monotonic):
+    self.clock = clock
+    self._shards = [(threading.Lock(), OrderedDict()) for _ in range(max(1, shards))]
+    self._shard_size = max(1, max_keys // len(self._shards))
+
+  def take(self, key: str, capacity: float, rate: float) -> float:
+    lock, buckets = self._shards[hash(key) % len(self._shards)]
+    now = self.clock()
+    with lock:
+      tokens, stamp = buckets.pop(key, (capacity, now))
+      tokens, wait = _take(tokens, now - stamp, capacity, rate)
+      buckets[key] = (tokens, now)
+      if len(buckets) > self._shard_size:
+        buckets.popitem(last=False)
+    return wait
+
+
+class RedisBuckets:
+  """Token buckets shared by every worker, one hash per key in a Redis-compatible server.
+
+  Buckets expire once they would be full again, so idle clients cost no
+  memory.
+  """
+
+  blocking = True
+
+  def __init__(self, client, prefix: str = 'ratelimit'):
+    self.client = client
+    self.prefix = prefix
+
+  def take(self, key: str, capacity: float, rate: float) -> float:
+    return float(self.client.eval(TAKE_SCRIPT, 1, f'{self.prefix}:{key}', capacity, rate))
+
+
+class FakeRedis:
+  """In-process stand-in for the ``EVAL`` of ``TAKE_SCRIPT`` that ``RedisBuckets`` sends.
+
+  Selected with ``RATE_LIMIT_REDIS_URL=fake://`` to exercise the shared
+  backend without a server; the script runs as its Python equivalent.
+  """
+
+  def __init__(self, clock=time.monotonic):
+    self._buckets = MemoryBuckets(shards=1, max_keys=1_000_000, clock=clock)
+
+  def eval(self, script: str, numkeys: int, key: str, capacity: float, rate: float) -> bytes:
+    return repr(self._buckets.take(key, float(capacity), float(rate))).encode()
+
+
+class RateLimiter:
+  """Per client address and per account token buckets over a storage backend.
+
+  Attributes:
+    backend (MemoryBuckets | RedisBuckets): Storage for the bucket state.
+    limits (dict): ``(capacity, tokens per second)`` of the ``ip`` and ``account`` buckets.
+  """
+
+  def __init__(self, backend, ip_burst: int, ip_per_minute: float, account_burst: int, account_per_minute: float):
+    self.backend = backend
+    self.limits = {
+      'ip': (float(ip_burst), ip_per_minute / 60),
+      'account': (float(account_burst), account_per_minute / 60),
+    }
+
+  def take(self, bucket: str, identity: str) -> float:
+    """Take a token from the bucket of an identity.
+
+    A failing backend lets the request through rather than locking everyone out.
+
+    Args:
+      bucket (str): ``ip`` or ``account``.
+      identity (str): Client address or normalized account name.
+
+    Returns:
+      float: Seconds until a token is available, 0 when the request may proceed.
+    """
+    capacity, rate = self.limits[bucket]
+    if capacity <= 0 or rate <= 0:
+      return 0.0
+    try:
+      return self.backend.take(f'{bucket}:{identity}', capacity, rate)
+    except Exception:
+      RATE_LIMIT_ERRORS.inc()
+      logger.exception("Rate limit backend failed, letting the request through")
+      return 0.0
+
+  async def take_async(self, bucket: str, identity: str) -> float:
+    """Same as ``take``, off the event loop when the backend does network I/O."""
+    if self.backend.blocking:
+      return await run_in_threadpool(self.take, bucket, identity)
+    return self.take(bucket, identity)
+
+
+async def _read_body(receive) -> Optional[bytes]:
+  """Read the request body, giving up once it passes ``MAX_BODY_BYTES``.
+
+  Returns:
+    Optional[bytes]: Whole body, None when it is too large.
+  """
+  chunks, size = [], 0
+  while True:
+    message = await receive()
+    if message['type'] != 'http.request':
+      break
+    chunks.append(message.get('body', b''))
+    size += len(chunks[-1])
+    if size > MAX_BODY_BYTES:
+      return None
+    if not message.get('more_body', False):
+      break
+  return b''.join(chunks)
+
+
+def _replay(body: bytes, receive):
+  """Receive callable handing out the already read body before deferring to ``receive``."""
+  pending = True
+
+  async def replay():
+    nonlocal pending
+    if pending:
+      pending = False
+      return {'type': 'http.request', 'body': body, 'more_body': False}
+    return await receive()
+
+  return replay
+
+
+async def _disconnected():
+  return {'type': 'http.disconnect'}
+
+
+async def _account(scope, body: bytes, field: str) -> Optional[str]:
+  """Extract the account named in a JSON or form body.
+
+  Returns:
+    Optional[str]: Lower cased account hashed with SHA-256, None when the body does not name one.
+  """
+  request = Request(dict(scope), _replay(body, _disconnected))
+  try:
+    if request.headers.get('content-type', '').startswith('application/json'):
+      payload = json.loads(body)
+      value = payload.get(field) if isinstance(payload, dict) else None
+    else:
+      async with request.form() as form:
+        value = form.get(field)
+  except Exception:
+    return None
+  if not isinstance(value, str) or not value.strip():
+    return None
+  return hashlib.sha256(value.strip().lower().encode()).hexdigest()
+
+
+class RateLimitMiddleware:
+  """Throttle the authentication endpoints before they touch the database or bcrypt.
+
+  A POST to a path of ``ACCOUNT_FIELDS`` takes a token from the bucket of the
+  client address, and once the body is read, from the bucket of the account
+  it names. An empty bucket answers 429 with ``Retry-After``, and a body
+  over ``MAX_BODY_BYTES`` answers 413 without being buffered. The address is
+  the ASGI client, so behind a proxy the server must be started with its
+  forwarded headers trusted.
+  """
+
+  def __init__(self, app, limiter: RateLimiter):
+    self.app = app
+    self.limiter = limiter
+
+  async def __call__(self, scope, receive, send):
+    field = ACCOUNT_FIELDS.get(scope.get('path')) if scope['type'] == 'http' and scope['method'] == 'POST' else None
+    if field is None:
+      await self.app(scope, receive, send)
+      return
+    client = scope.get('client')
+    wait = await self.limiter.take_async('ip', client[0] if client else 'unknown')
+    if wait:
+      await self._reject('ip', wait, scope, receive, send)
+      return
+    body = await _read_body(receive)
+    if body is None:
+      response = JSONResponse({'detail': 'Solicitud demasiado grande.'}, status_code=413)
+      await response(scope, receive, send)
+      return
+    account = await _account(scope, body, field)
+    if account is not None:
+      wait = await self.limiter.take_async('account', account)
+      if wait:
+        await self._reject('account', wait, scope, receive, send)
+        return
+    await self.app(scope, _replay(body, receive), send)
+
+  async def _reject(self, bucket: str, wait: float, scope, receive, send) -> None:
+    RATE_LIMIT_REJECTIONS.inc(bucket=bucket)
+    response = JSONResponse(
+      {'detail': 'Demasiados intentos, intente nuevamente más tarde.'},
+      status_code=429,
+      headers={'Retry-After': str(max(1, math.ceil(wait)))},
+    )
+    await response(scope, receive, send)
+
+
+def build_backend():
+  """Instantiate the bucket storage selected by ``RATE_LIMIT_BACKEND``.
+
+  Returns:
+    MemoryBuckets | RedisBuckets: Storage for the token buckets.
+  """
+  if settings.RATE_LIMIT_BACKEND == 'memory':
+    return MemoryBuckets(settings.RATE_LIMIT_SHARDS, settings.RATE_LIMIT_MAX_KEYS)
+  if settings.RATE_LIMIT_BACKEND != 'redis':
+    raise ValueError(f'unknown RATE_LIMIT_BACKEND: {settings.RATE_LIMIT_BACKEND!r}')
+  if settings.RATE_LIMIT_REDIS_URL.startswith('fake://'):
+    return RedisBuckets(FakeRedis())
+  # redis is only required by this backend, so it is not a hard dependency.
+  import redis
+  return RedisBuckets(redis.Redis.from_url(settings.RATE_LIMIT_REDIS_URL))
+
+
+def build_limiter() -> RateLimiter:
+  """Create the limiter described by the ``RATE_LIMIT_*`` settings.
+
+  Returns:
+    RateLimiter: Limiter for ``RateLimitMiddleware``.
+  """
+  return RateLimiter(
+    build_backend(),
+    settings.RATE_LIMIT_IP_BURST,
+    settings.RATE_LIMIT_IP_PER_MINUTE,
+    settings.RATE_LIMIT_ACCOUNT_BURST,
+    settings.RATE_LIMIT_ACCOUNT_PER_MINUTE,
+  )
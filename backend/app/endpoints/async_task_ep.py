@@ -0,0 +1,497 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute, generate_unique_id
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated, List, Optional
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.schemas.task_schemas import TaskBulkResult, TaskBulkUpdate, TaskCreate, TaskImportResult, TaskMove, TaskOut, TaskPage, TaskStats, TaskSync, TaskUpdate
+from app.services import async_task_service, import_service, task_service
+from app.utils import auth
+from app.utils.etag import conditional_response, make_etag
+from app.utils.sse import task_event_stream
+
+
+def async_unique_id(route: APIRoute) -> str:
+  """Keep operation ids distinct from the synchronous routes they shadow.
+
+  Args:
+    route (APIRoute): Route whose OpenAPI operation id is being generated.
+
+  Returns:
+    str: Default FastAPI id prefixed with ``async_``.
+  """
+  return f"async_{generate_unique_id(route)}"
+
+
+# Registered ahead of task_ep when ASYNC_DATABASE_URL is set: these routes
+# shadow their synchronous twins, everything else falls through to task_ep.
+router = APIRouter(
+  prefix='/tasks',
+  tags=['Tasks'],
+  generate_unique_id_function=async_unique_id,
+)
+
+
+@router.post(
+  "/create",
+  response_model=TaskOut,
+  status_code=status.HTTP_201_CREATED,
+)
+async def create_task(task: TaskCreate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(auth.get_current_user)):
+  """Create a new task owned by the authenticated user.
+
+  Args:
+    task (TaskCreate): Payload with the task details.
+    db (AsyncSession): Async database session injected by FastAPI.
+    current_user (dict): Authenticated principal info provided by the token.
+
+  Returns:
+    TaskOut: Newly created task serialized for the response.
+  """
+  user_id = int(current_user['user_id'])
+  return await async_task_service.create_task(task, user_id, db)
+
+
+@router.get(
+  "/",
+  response_model=TaskPage,
+  status_code=status.HTTP_200_OK,
+)
+async def get_all_task(
+  db: AsyncSession = Depends(get_async_db),
+  limit: int = Query(task_service.DEFAULT_PAGE_SIZE, ge=1, le=task_service.MAX_PAGE_SIZE),
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+):
+  """Fetch one page of the tasks stored in the system.
+
+  With ``TASK_JSON_FAST_PATH`` the page is serialized straight from column
+  tuples instead of going through ``TaskPage``.
+
+  Args:
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks in the page.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only return tasks with this completion flag.
+    task_type (Optional[str]): Only return tasks of this category.
+
+  Returns:
+    TaskPage: Tasks regardless of owner plus the cursor for the next page.
+  """
+  if settings.TASK_JSON_FAST_PATH:
+    page = await async_task_service.get_all_tasks_json(db, limit, after, completed, task_type)
+    return Response(page, media_type='application/json')
+  return await async_task_service.get_all_tasks(db, limit, after, completed, task_type)
+
+
+@router.get(
+  "/stream",
+  status_code=status.HTTP_200_OK,
+  response_class=StreamingResponse,
+)
+async def stream_tasks(request: Request, user: dict = Depends(auth.get_current_user)):
+  """Stream the changes made to the authenticated user's tasks as Server-Sent Events.
+
+  Declared before ``/{task_id}`` so the path is not parsed as an identifier.
+
+  Args:
+    request (Request): Incoming request, polled to detect disconnections.
+    user (dict): Authenticated principal info provided by the token.
+
+  Returns:
+    StreamingResponse: ``text/event-stream`` with ``created``, ``updated`` and ``deleted`` events.
+  """
+  return task_event_stream(request, int(user['user_id']))
+
+
+@router.get(
+  "/sync",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskSync,
+)
+async def sync_tasks(
+  request: Request,
+  response: Response,
+  since: int = Query(0, ge=0),
+  user: dict = Depends(auth.get_current_user),
+  db: AsyncSession = Depends(get_async_db),
+):
+  """Return the task writes made after the revision the client already has.
+
+  Answers 304 when ``If-None-Match`` shows nothing changed since the last sync.
+
+  Args:
+    request (Request): Incoming request, inspected for ``If-None-Match``.
+    response (Response): Outgoing response that receives the ETag.
+    since (int): Revision returned by the previous sync, 0 to ask for a reload.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    TaskSync: Upserted tasks, deleted ids and the revision to sync from next time.
+  """
+  user_id = int(user['user_id'])
+  revision = await async_task_service.get_task_revision(user_id, db)
+  not_modified = conditional_response(request, response, make_etag('sync', user_id, revision, query=request.url.query))
+  if not_modified is not None:
+    return not_modified
+  return await async_task_service.get_changes_since(user_id, since, db)
+
+
+@router.get(
+  "/export",
+  status_code=status.HTTP_200_OK,
+  response_class=StreamingResponse,
+)
+async def export_tasks(
+  export_format: str = Query('ndjson', alias='format', pattern='^(ndjson|csv)$'),
+  user: dict = Depends(auth.get_current_user),
+):
+  """Download every task of the authenticated user as NDJSON or CSV.
+
+  The body is streamed batch by batch through the async engine, so large
+  accounts are exported in constant memory without holding a threadpool slot.
+
+  Args:
+    export_format (str): ``ndjson`` (default) or ``csv``, sent as ``format``.
+    user (dict): Authenticated principal info provided by the token.
+
+  Returns:
+    StreamingResponse: Tasks in position order, one per line.
+  """
+  user_id = int(user['user_id'])
+  return StreamingResponse(
+    async_task_service.export_tasks(user_id, export_format),
+    media_type=task_service.EXPORT_MEDIA_TYPES[export_format],
+    headers={'Content-Disposition': f'attachment; filename="tasks.{export_format}"'},
+  )
+
+
+@router.get(
+  "/search",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskPage,
+)
+async def search_tasks(
+  q: str = Query(min_length=1, max_length=100),
+  user: dict = Depends(auth.get_current_user),
+  db: AsyncSession = Depends(get_async_db),
+  limit: int = Query(task_service.DEFAULT_PAGE_SIZE, ge=1, le=task_service.MAX_PAGE_SIZE),
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+):
+  """Search the authenticated user's tasks by title and description.
+
+  Results come from the full-text index, best matches first.
+
+  Args:
+    q (str): Words to look for, each one matched as a prefix.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks in the page.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only return tasks with this completion flag.
+    task_type (Optional[str]): Only return tasks of this category.
+
+  Returns:
+    TaskPage: Matching tasks plus the cursor for the next page.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.search_tasks(user_id, q, db, limit, after, completed, task_type)
+
+
+@router.get(
+  "/stats",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskStats,
+)
+async def get_task_stats(user: dict = Depends(auth.get_current_user), db: AsyncSession = Depends(get_async_db)):
+  """Return the task counts of the authenticated user, overall and per category.
+
+  Served from counters kept up to date by every write, so the cost does not
+  grow with the number of tasks.
+
+  Args:
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    TaskStats: Total and completed tasks, overall and by ``task_type``.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.get_task_stats(user_id, db)
+
+
+@router.get(
+  "/{task_id}",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskOut,
+)
+async def get_task_by_id(task_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+  """Retrieve a task by identifier.
+
+  Answers 304 when ``If-None-Match`` carries the current ETag of the task.
+
+  Args:
+    task_id (int): Primary key of the task to load.
+    request (Request): Incoming request, inspected for ``If-None-Match``.
+    response (Response): Outgoing response that receives the ETag.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When the task does not exist.
+
+  Returns:
+    TaskOut: Task that matches the provided identifier.
+  """
+  revision = await async_task_service.get_task_revision_for_task(task_id, db)
+  if revision is None:
+    raise HTTPException(
+      status_code=400,
+      detail="Tarea no encontrada.",
+    )
+  not_modified = conditional_response(request, response, make_etag('task', task_id, revision))
+  if not_modified is not None:
+    return not_modified
+  task_db = await async_task_service.get_task_by_id(task_id, db)
+  if task_db is None:
+    raise HTTPException(
+      status_code=400,
+      detail="Tarea no encontrada.",
+    )
+  return task_db
+
+
+@router.get(
+  "/get-from-user/{user_id}",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskPage,
+)
+async def get_all_tasks_from_user(
+  request: Request,
+  response: Response,
+  user: dict = Depends(auth.get_current_user),
+  db: AsyncSession = Depends(get_async_db),
+  limit: int = Query(task_service.DEFAULT_PAGE_SIZE, ge=1, le=task_service.MAX_PAGE_SIZE),
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+):
+  """Return one page of the tasks that belong to the authenticated user.
+
+  Answers 304 without loading any task when ``If-None-Match`` carries the
+  current ETag, which is derived from the user's task revision. Other
+  requests are served from the task list cache when it holds the page for
+  that revision.
+
+  Args:
+    request (Request): Incoming request, inspected for ``If-None-Match``.
+    response (Response): Outgoing response that receives the ETag.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks in the page.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only return tasks with this completion flag.
+    task_type (Optional[str]): Only return tasks of this category.
+
+  Returns:
+    TaskPage: Tasks linked to the requesting user plus the cursor for the next page.
+  """
+  user_id = int(user['user_id'])
+  revision = await async_task_service.get_task_revision(user_id, db)
+  etag = make_etag('tasks', user_id, revision, query=request.url.query)
+  not_modified = conditional_response(request, response, etag)
+  if not_modified is not None:
+    return not_modified
+  page = await async_task_service.get_cached_tasks_from_user(
+    user_id, revision, request.url.query, db, limit, after, completed, task_type
+  )
+  return Response(page, media_type='application/json', headers=response.headers)
+
+
+@router.put(
+  "/update/{task_id}",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskOut,
+)
+async def update_task(task: TaskUpdate, task_id: int, user: dict = Depends(auth.get_current_user), db: AsyncSession = Depends(get_async_db)):
+  """Update an existing task with the provided changes.
+
+  Args:
+    task (TaskUpdate): Partial payload describing the update.
+    task_id (int): Identifier of the task to modify.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When the target task does not exist for the user.
+
+  Returns:
+    TaskOut: Updated task data serialized for the response.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.update_task(task, task_id, user_id, db)
+
+
+@router.put(
+  "/move/{task_id}",
+  status_code=status.HTTP_200_OK,
+  response_model=TaskOut,
+)
+async def move_task(move: TaskMove, task_id: int, user: dict = Depends(auth.get_current_user), db: AsyncSession = Depends(get_async_db)):
+  """Place a task between two others in the user's list.
+
+  Args:
+    move (TaskMove): Neighbours the task should end up between.
+    task_id (int): Identifier of the task to move.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When a task does not exist for the user or the neighbours are not adjacent.
+
+  Returns:
+    TaskOut: Moved task with its new position.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.move_task(task_id, move, user_id, db)
+
+
+@router.delete(
+  '/delete/{task_id}',
+  status_code=status.HTTP_200_OK,
+)
+async def delete_task(task_id: int, user: dict = Depends(auth.get_current_user), db: AsyncSession = Depends(get_async_db)):
+  """Delete a task owned by the authenticated user.
+
+  Args:
+    task_id (int): Identifier of the task to delete.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    None: The deletion is performed for its side effects.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.delete_task(task_id, user_id, db)
+
+
+@router.delete(
+  '/delete_completed',
+  status_code=status.HTTP_200_OK,
+)
+async def delete_completed_tasks(user: dict = Depends(auth.get_current_user), db: AsyncSession = Depends(get_async_db)):
+  """Erase every completed task associated with the authenticated user.
+
+  Args:
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    dict[str, int]: Number of tasks removed.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.delete_completed_tasks(user_id, db)
+
+
+@router.post(
+  '/bulk/create',
+  response_model=List[TaskBulkResult],
+  status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks(
+  tasks: Annotated[List[TaskCreate], Body(max_length=task_service.MAX_BULK_SIZE)],
+  user: dict = Depends(auth.get_current_user),
+  db: AsyncSession = Depends(get_async_db),
+):
+  """Create several tasks for the authenticated user in one transaction.
+
+  Args:
+    tasks (List[TaskCreate]): Payloads with the task details.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    List[TaskBulkResult]: Created tasks, in request order.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.create_tasks(tasks, user_id, db)
+
+
+@router.post(
+  '/import',
+  response_model=TaskImportResult,
+  status_code=status.HTTP_200_OK,
+)
+async def import_tasks(
+  request: Request,
+  import_format: str = Query('ndjson', alias='format', pattern='^(ndjson|csv)$'),
+  user: dict = Depends(auth.get_current_user),
+):
+  """Import tasks from an NDJSON or CSV request body.
+
+  The body is parsed as it arrives and stored in batches through the async
+  engine, so uploads of any size run in bounded memory. CSV uploads need a
+  header row; the files produced by ``/tasks/export`` are accepted as is.
+
+  Args:
+    request (Request): Incoming request whose body holds the file.
+    import_format (str): ``ndjson`` (default) or ``csv``, sent as ``format``.
+    user (dict): Authenticated principal info provided by the token.
+
+  Returns:
+    TaskImportResult: Imported and rejected row counts with the first errors.
+  """
+  user_id = int(user['user_id'])
+  return await import_service.import_tasks(request.stream(), import_format, user_id, use_async=True)
+
+
+@router.put(
+  '/bulk/update',
+  response_model=List[TaskBulkResult],
+  status_code=status.HTTP_200_OK,
+)
+async def update_tasks(
+  tasks: Annotated[List[TaskBulkUpdate], Body(max_length=task_service.MAX_BULK_SIZE)],
+  user: dict = Depends(auth.get_current_user),
+  db: AsyncSession = Depends(get_async_db),
+):
+  """Update several tasks of the authenticated user in one transaction.
+
+  Args:
+    tasks (List[TaskBulkUpdate]): Partial payloads, each carrying the task id.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    List[TaskBulkResult]: Per item outcome, ``not_found`` for foreign or missing tasks.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.update_tasks(tasks, user_id, db)
+
+
+@router.post(
+  '/bulk/delete',
+  response_model=List[TaskBulkResult],
+  status_code=status.HTTP_200_OK,
+)
+async def delete_tasks(
+  task_ids: Annotated[List[int], Body(max_length=task_service.MAX_BULK_SIZE)],
+  user: dict = Depends(auth.get_current_user),
+  db: AsyncSession = Depends(get_async_db),
+):
+  """Delete several tasks of the authenticated user in one statement.
+
+  Args:
+    task_ids (List[int]): Identifiers of the tasks to delete.
+    user (dict): Authenticated principal info provided by the token.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    List[TaskBulkResult]: Per item outcome, ``not_found`` for foreign or missing tasks.
+  """
+  user_id = int(user['user_id'])
+  return await async_task_service.delete_tasks(task_ids, user_id, db)
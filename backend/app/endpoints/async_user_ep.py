@@ -0,0 +1,149 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+from fastapi.security import OAuth2PasswordRequestForm
+from app.schemas.user_schemas import UserCreate, UserOut, Token
+from app.core.database import get_async_db
+from app.endpoints.async_task_ep import async_unique_id
+from app.services import async_user_service
+from app.utils import auth as user_auth
+
+# Registered ahead of user_ep when ASYNC_DATABASE_URL is set, so these routes
+# shadow their synchronous twins.
+router = APIRouter(
+  prefix='/auth',
+  tags=['Auth'],
+  generate_unique_id_function=async_unique_id,
+)
+
+
+@router.post(
+  "/create",
+  response_model=UserOut,
+  status_code=status.HTTP_201_CREATED,
+)
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+  """Register a new user account.
+
+  Args:
+    user (UserCreate): Payload containing email and password.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When the email is already registered.
+
+  Returns:
+    UserOut: Serialized representation of the stored user.
+  """
+  user_db = await async_user_service.get_user_by_email(user.email, db)
+  if user_db:
+    raise HTTPException(
+      status_code=400,
+      detail="El usuario ya existe.",
+    )
+  return await async_user_service.create_user(user, db)
+
+
+@router.post(
+  "/token",
+  status_code=status.HTTP_200_OK,
+  response_model=Token,
+)
+async def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: AsyncSession = Depends(get_async_db)):
+  """Issue an access token for valid credentials.
+
+  Args:
+    form_data (OAuth2PasswordRequestForm): Username and password generated by OAuth2 flow.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When the credentials cannot be verified.
+
+  Returns:
+    Token: Access token payload used by the frontend.
+  """
+  user = await async_user_service.authenticate_user(form_data.username, form_data.password, db)
+  if not user:
+    raise HTTPException(
+      status_code=401,
+      detail="El usuario no se pudo validar.",
+    )
+  token = user_auth.create_token(user.email, user.id, timedelta(minutes=20))
+  return {'access_token': token, 'token_type': 'bearer'}
+
+
+@router.get(
+  '/me',
+  response_model=UserOut,
+  status_code=status.HTTP_200_OK,
+)
+async def get_current_user(current_user: dict = Depends(user_auth.get_current_user)):
+  """Provide the profile of the authenticated user.
+
+  Declared here so that ``/auth/me`` is not captured by ``/auth/{user_id}``.
+
+  Args:
+    current_user (dict): Principal information extracted from the access token.
+
+  Returns:
+    dict[str, int | str]: Minimal payload with the user identifier and email.
+  """
+  return {
+    "id": current_user["user_id"],
+    "email": current_user["user_email"],
+  }
+
+
+@router.get(
+  '/{user_id}',
+  response_model=UserOut,
+  status_code=status.HTTP_200_OK,
+)
+async def get_user_by_id(user_id: int, db: AsyncSession = Depends(get_async_db)):
+  """Fetch a user by identifier.
+
+  Args:
+    user_id (int): Primary key of the user to retrieve.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When the user does not exist.
+
+  Returns:
+    UserOut: Serialized representation of the stored user.
+  """
+  user_db = await async_user_service.get_user_by_id(user_id, db)
+  if user_db is None:
+    raise HTTPException(
+      status_code=404,
+      detail="Usuario no encontrado.",
+    )
+  return user_db
+
+
+@router.get(
+  '/email/{user_email}',
+  response_model=UserOut,
+  status_code=status.HTTP_200_OK,
+)
+async def get_user_by_email(user_email: str, db: AsyncSession = Depends(get_async_db)):
+  """Fetch a user by email address.
+
+  Args:
+    user_email (str): Address used to perform the lookup.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Raises:
+    HTTPException: When the user does not exist.
+
+  Returns:
+    UserOut: Serialized representation of the stored user.
+  """
+  user_db = await async_user_service.get_user_by_email(user_email, db)
+  if user_db is None:
+    raise HTTPException(
+      status_code=404,
+      detail="Usuario no encontrado.",
+    )
+  return user_db
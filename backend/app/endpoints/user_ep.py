@@ -46,7 +46,7 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
   status_code=status.HTTP_200_OK,
   response_model=Token,
 )
-async def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: Session = Depends(get_db)):
+def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: Session = Depends(get_db)):
   """Issue an access token for valid credentials.
 
   Args:
@@ -1,29 +1,86 @@
 import logging
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import PlainTextResponse
+from app.core import metrics
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.endpoints import task_ep, user_ep
-
-app = FastAPI(
-  title="To-Do API",
-  version="0.1.0",
-  docs_url="/docs",
-  redoc_url="/redoc"
-)
-
-app.add_middleware(
-  CORSMiddleware,
-  allow_origins = settings.BACKEND_CORS_ORIGINS,
-  allow_credentials=True,
-  allow_methods=["*"],
-  allow_headers=["*"]
-)
-
-app.include_router(task_ep.router)
-app.include_router(user_ep.router)
-
-@app.get("/")
+
+router = APIRouter()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  """Attach the task event broker and cache on startup, release them on shutdown.
+
+  Both are built before the first request so every committed write reaches
+  them, even in a worker that has not served a stream or a list yet.
+
+  Args:
+    app (FastAPI): Application being served.
+  """
+  from app.core.broker import get_broker
+  from app.core.cache import get_task_list_cache
+  get_task_list_cache()
+  get_broker()
+  yield
+  get_broker().close()
+
+def create_app() -> FastAPI:
+  """Build the application with its middleware and routers.
+
+  Routers, and everything they import, are only loaded here, so importing
+  this module stays cheap. The engines, the bcrypt context and the caches
+  are created on first use.
+
+  Returns:
+    FastAPI: Application ready to be served.
+  """
+  from fastapi.middleware.cors import CORSMiddleware
+  from app.core.profiling import ProfilingMiddleware
+  from app.endpoints import task_ep, user_ep
+
+  app = FastAPI(
+    title="To-Do API",
+    version="0.1.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+  )
+
+  # Added first so it runs inside CORS and browsers can read its 429s.
+  if settings.RATE_LIMIT_ENABLED:
+    from app.core.ratelimit import RateLimitMiddleware, build_limiter
+    app.add_middleware(RateLimitMiddleware, limiter=build_limiter())
+
+  app.add_middleware(
+    CORSMiddleware,
+    allow_origins = settings.BACKEND_CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"]
+  )
+
+  # Added last so it wraps everything else and times the whole request.
+  if settings.REQUEST_PROFILING:
+    app.add_middleware(ProfilingMiddleware, n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD)
+
+  if settings.ASYNC_DATABASE_URL:
+    from app.endpoints import async_task_ep, async_user_ep
+    app.include_router(async_task_ep.router)
+    app.include_router(async_user_ep.router)
+  app.include_router(task_ep.router)
+  app.include_router(user_ep.router)
+  app.include_router(router)
+  return app
+
+def __getattr__(name: str):
+  # ``uvicorn app.main:app`` and ``from app.main import app`` keep working,
+  # the application is built the first time it is looked up.
+  if name == "app":
+    app = globals()["app"] = create_app()
+    return app
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@router.get("/")
 def read_root():
   """Return a greeting payload for health checks.
 
@@ -32,7 +89,7 @@ def read_root():
   """
   return {"message": "Hello World"}
 
-@app.get("/health", tags=["Health"])
+@router.get("/health", tags=["Health"])
 async def health():
   """Expose a liveness endpoint for monitoring tools.
 
@@ -40,3 +97,12 @@ async def health():
     dict[str, str]: Status payload indicating the service is operational.
   """
   return {"status": "ok"}
+
+@router.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def read_metrics():
+  """Expose process metrics in the Prometheus text format.
+
+  Returns:
+    PlainTextResponse: Current value of every registered metric.
+  """
+  return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4")
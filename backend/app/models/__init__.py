@@ -1,2 +1,2 @@
 from .user_models import User
-from .task_models import Task
\ No newline at end of file
+from .task_models import Task, TaskCounter, TaskTombstone
\ No newline at end of file
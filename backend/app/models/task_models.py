@@ -1,5 +1,5 @@
 from app.core.database import Base
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey
+from sqlalchemy import DDL, Column, String, Integer, Boolean, DateTime, ForeignKey, Index, event, func
 from sqlalchemy.orm import Relationship
 from .user_models import User
 
@@ -15,10 +15,20 @@ class Task(Base):
     task_type (Column[str]): Category tag such as work, personal, or study.
     completed (Column[bool]): Flag that indicates whether the task is done.
     user_id (Column[int]): Foreign key referencing the owning user.
+    position (Column[str]): Fractional order key, tasks are listed by ascending position.
+    revision (Column[int]): Task revision of the owner when the task was last written.
+    updated_at (Column[datetime]): Timestamp of the last write to the task.
     owner (Relationship[User]): SQLAlchemy relationship back to the user.
   """
 
   __tablename__ = 'tasks'
+  __table_args__ = (
+    Index('ix_tasks_user_id_id', 'user_id', 'id'),
+    Index('ix_tasks_user_id_completed', 'user_id', 'completed'),
+    Index('ix_tasks_user_id_task_type', 'user_id', 'task_type'),
+    Index('ix_tasks_user_id_position', 'user_id', 'position'),
+    Index('ix_tasks_user_id_revision', 'user_id', 'revision'),
+  )
   id = Column(
     Integer,
     primary_key=True,
@@ -44,5 +54,123 @@ class Task(Base):
     Integer,
     ForeignKey('users.id', ondelete='CASCADE'),
   )
+  position = Column(
+    String(255),
+    nullable=False,
+  )
+  revision = Column(
+    Integer,
+    nullable=False,
+    default=0,
+    server_default='0',
+  )
+  updated_at = Column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now(),
+    onupdate=func.now(),
+  )
 
   owner = Relationship('User', back_populates='tasks')
+
+
+
+class TaskCounter(Base):
+  """Number of tasks a user has for one category and completion flag.
+
+  Maintained by every write in ``task_service`` within the same transaction,
+  so aggregates are read without scanning the tasks table.
+
+  Attributes:
+    __tablename__ (str): Name of the table managed by SQLAlchemy.
+    user_id (Column[int]): Foreign key referencing the owner of the tasks.
+    task_type (Column[str]): Category the row counts.
+    completed (Column[bool]): Completion flag the row counts.
+    count (Column[int]): Tasks of the user with that category and flag.
+  """
+
+  __tablename__ = 'task_counters'
+  user_id = Column(
+    Integer,
+    ForeignKey('users.id', ondelete='CASCADE'),
+    primary_key=True,
+  )
+  task_type = Column(
+    String(50),
+    primary_key=True,
+  )
+  completed = Column(
+    Boolean,
+    primary_key=True,
+  )
+  count = Column(
+    Integer,
+    nullable=False,
+    default=0,
+    server_default='0',
+  )
+
+# Full-text index over title and description. Postgres keeps a generated
+# ``search_vector`` column with a GIN index; SQLite, used for local runs, keeps
+# an external content FTS5 table in sync through triggers. Neither is mapped on
+# the model, ``task_service.search_tasks`` addresses them directly.
+SEARCH_CONFIG = 'simple'
+TASK_SEARCH_DDL = {
+  'postgresql': (
+    "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')) STORED",
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)",
+  ),
+  'sqlite': (
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, content='tasks', content_rowid='id')",
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+  ),
+}
+for dialect, statements in TASK_SEARCH_DDL.items():
+  for statement in statements:
+    event.listen(Task.__table__, 'after_create', DDL(statement).execute_if(dialect=dialect))
+event.listen(Task.__table__, 'after_drop', DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect='sqlite'))
+
+
+class TaskTombstone(Base):
+  """Marker left behind by a deleted task so offline clients can sync the deletion.
+
+  Attributes:
+    __tablename__ (str): Name of the table managed by SQLAlchemy.
+    task_id (Column[int]): Identifier the deleted task had.
+    user_id (Column[int]): Foreign key referencing the user that owned the task.
+    revision (Column[int]): Task revision of the owner when the task was deleted.
+    deleted_at (Column[datetime]): Timestamp of the deletion.
+  """
+
+  __tablename__ = 'task_tombstones'
+  __table_args__ = (
+    Index('ix_task_tombstones_user_id_revision', 'user_id', 'revision'),
+  )
+  task_id = Column(
+    Integer,
+    primary_key=True,
+  )
+  user_id = Column(
+    Integer,
+    ForeignKey('users.id', ondelete='CASCADE'),
+    nullable=False,
+  )
+  revision = Column(
+    Integer,
+    primary_key=True,
+  )
+  deleted_at = Column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now(),
+  )
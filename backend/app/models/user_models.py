@@ -11,6 +11,7 @@ class User(Base):
     id (Column[int]): Auto incremented identifier for each user.
     email (Column[str]): Unique email address used for login.
     hashed_password (Column[str]): Bcrypt hashed password for authentication.
+    task_revision (Column[int]): Counter bumped by every write to the user's tasks.
     tasks (Relationship['Task']): Reverse relationship to managed tasks.
   """
 
@@ -24,10 +25,18 @@ class User(Base):
   email = Column(
     String(30),
     nullable=False,
+    unique=True,
+    index=True,
   )
   hashed_password = Column(
     String(60),
     nullable=False,
   )
+  task_revision = Column(
+    Integer,
+    nullable=False,
+    default=0,
+    server_default='0',
+  )
 
   tasks = Relationship('Task', back_populates="owner", cascade="all, delete")
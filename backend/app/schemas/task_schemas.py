@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class TaskBase(BaseModel):
@@ -31,8 +31,8 @@ class TaskBase(BaseModel):
     return value
 
   @field_validator("description")
-  def validate_description(value: str) -> str:
-    if len(value) > 50:
+  def validate_description(value: Optional[str]) -> Optional[str]:
+    if value is not None and len(value) > 50:
       raise ValueError('Description too long, 50 characters max')
     return value
 
@@ -63,25 +63,146 @@ class TaskUpdate(BaseModel):
     return value
   
   @field_validator("title")
-  def validate_title(value: str) -> str:
-    if len(value) > 30:
+  def validate_title(value: Optional[str]) -> Optional[str]:
+    if value is not None and len(value) > 30:
       raise ValueError('Title too long')
     return value
   @field_validator("description")
-  def validate_description(value: str) -> str:
-    if len(value) > 50:
+  def validate_description(value: Optional[str]) -> Optional[str]:
+    if value is not None and len(value) > 50:
       raise ValueError('Description too long')
+    return value
+
+class TaskBulkUpdate(TaskUpdate):
+  """Partial update addressed to one task inside a bulk request.
+
+  Attributes:
+    id (int): Identifier of the task to modify.
+  """
+
+  id: int
+
+class TaskMove(BaseModel):
+  """New neighbours of a task being reordered.
+
+  At least one neighbour is required; the other one is looked up server side.
+
+  Attributes:
+    after_id (Optional[int]): Task that should end up right before the moved one.
+    before_id (Optional[int]): Task that should end up right after the moved one.
+  """
+
+  after_id: Optional[int] = None
+  before_id: Optional[int] = None
 
 class TaskOut(TaskBase):
   """Representation of a task returned to the client.
 
   Attributes:
     id (int): Identifier assigned by the database.
+    position (str): Order key, tasks sort by ascending position.
+    revision (int): Task revision of the owner when the task was last written.
   """
 
   id: int
+  position: str
+  revision: int
 
   class Config:
     """Allow conversion from SQLAlchemy objects."""
 
     from_attributes = True
+
+
+class TaskPage(BaseModel):
+  """Slice of a task listing returned by the paginated endpoints.
+
+  Attributes:
+    items (List[TaskOut]): Tasks contained in the current page.
+    next_cursor (Optional[str]): Opaque token to request the following page, None on the last one.
+  """
+
+  items: List[TaskOut]
+  next_cursor: Optional[str] = None
+
+
+class TaskBulkResult(BaseModel):
+  """Outcome of one item processed by a bulk endpoint.
+
+  Attributes:
+    id (Optional[int]): Identifier of the affected task, None if it could not be created.
+    status (str): One of created, updated, deleted or not_found.
+    task (Optional[TaskOut]): Stored task after the operation, when it still exists.
+  """
+
+  id: Optional[int] = None
+  status: str
+  task: Optional[TaskOut] = None
+
+
+class TaskSync(BaseModel):
+  """Changes to a user's tasks since a revision held by the client.
+
+  Attributes:
+    revision (int): Current task revision, to send as ``since`` on the next sync.
+    reset (bool): True when the client must reload its list through the paginated listing, no rows are sent then.
+    upserts (List[TaskOut]): Tasks created or modified after ``since``.
+    deletes (List[int]): Identifiers of the tasks deleted after ``since``.
+  """
+
+  revision: int
+  reset: bool = False
+  upserts: List[TaskOut]
+  deletes: List[int]
+
+
+class TaskImportError(BaseModel):
+  """Row of an import that could not be stored.
+
+  Attributes:
+    line (int): Line of the uploaded file, starting at 1.
+    detail (str): Reason the row was rejected.
+  """
+
+  line: int
+  detail: str
+
+
+class TaskImportResult(BaseModel):
+  """Outcome of a bulk import.
+
+  Attributes:
+    imported (int): Rows stored as new tasks.
+    failed (int): Rows rejected by validation.
+    errors (List[TaskImportError]): Details of the first rejected rows.
+  """
+
+  imported: int
+  failed: int
+  errors: List[TaskImportError]
+
+
+class TaskTypeStats(BaseModel):
+  """Task counts of one category.
+
+  Attributes:
+    total (int): Tasks of the category.
+    completed (int): Completed tasks of the category.
+  """
+
+  total: int
+  completed: int
+
+
+class TaskStats(BaseModel):
+  """Aggregates over every task of a user.
+
+  Attributes:
+    total (int): Tasks owned by the user.
+    completed (int): Completed tasks owned by the user.
+    by_type (Dict[str, TaskTypeStats]): Counts per category, only categories in use.
+  """
+
+  total: int
+  completed: int
+  by_type: Dict[str, TaskTypeStats]
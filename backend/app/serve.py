@@ -0,0 +1,124 @@
+"""Production launcher: ``python -m app.serve``.
+
+Runs the API under gunicorn's pre-fork master with uvicorn workers. The
+master imports the app and opens one database connection before forking, so
+every worker starts with the modules loaded and the dialect initialized, and
+each worker drops the inherited pool right after the fork. ``SIGHUP`` starts
+a new generation of workers and drains the old one, ``SIGTERM`` lets in-flight
+requests finish for up to ``SERVER_GRACEFUL_TIMEOUT`` seconds. Since the app
+is preloaded, code changes still need a full restart.
+
+Several workers need the shared backends, ``EVENTS_BACKEND=postgres`` and
+``RATE_LIMIT_BACKEND=redis``; with the in-memory ones a single worker runs.
+"""
+import os
+from typing import List
+from gunicorn.app.base import BaseApplication
+from app.core.config import settings
+
+
+def post_fork(server, worker) -> None:
+  """Give each worker its own connections instead of the master's.
+
+  Args:
+    server (Arbiter): Gunicorn master.
+    worker (Worker): Worker process that was just forked.
+  """
+  from app.core.database import get_engine
+  # close=False leaves the sockets to the master instead of closing them
+  # under its feet; the worker simply stops using them. The async engine is
+  # never created in the master, each worker builds its own on first use.
+  get_engine().dispose(close=False)
+
+
+def process_local_backends() -> List[str]:
+  """List the configured backends whose state lives in a single worker.
+
+  Returns:
+    List[str]: ``NAME=value`` of each setting that rules out several workers.
+  """
+  local = []
+  if settings.EVENTS_BACKEND == 'memory':
+    # Stream subscribers would only see the writes of their own worker.
+    local.append('EVENTS_BACKEND=memory')
+  if settings.RATE_LIMIT_ENABLED and settings.RATE_LIMIT_BACKEND == 'memory':
+    # Every worker would grant the whole budget on its own.
+    local.append('RATE_LIMIT_BACKEND=memory')
+  return local
+
+
+def worker_count() -> int:
+  """Resolve ``SERVER_WORKERS``, 0 meaning one per CPU core.
+
+  The default falls back to a single worker while a process-local backend
+  is configured.
+
+  Raises:
+    SystemExit: When several workers are requested explicitly with a process-local backend.
+
+  Returns:
+    int: Number of workers to start.
+  """
+  local = process_local_backends()
+  if settings.SERVER_WORKERS == 0:
+    return 1 if local else os.cpu_count() or 1
+  if settings.SERVER_WORKERS > 1 and local:
+    raise SystemExit(
+      f"SERVER_WORKERS={settings.SERVER_WORKERS} needs shared backends, but {', '.join(local)}; "
+      "set EVENTS_BACKEND=postgres and RATE_LIMIT_BACKEND=redis or run a single worker"
+    )
+  return settings.SERVER_WORKERS
+
+
+def worker_options() -> dict:
+  """Translate the ``SERVER_*`` settings into gunicorn options.
+
+  Returns:
+    dict: Gunicorn configuration for the launcher.
+  """
+  options = {
+    'bind': settings.SERVER_BIND,
+    'workers': worker_count(),
+    'worker_class': 'uvicorn_worker.UvicornWorker',
+    'backlog': settings.SERVER_BACKLOG,
+    'keepalive': settings.SERVER_KEEPALIVE,
+    'graceful_timeout': settings.SERVER_GRACEFUL_TIMEOUT,
+    'timeout': settings.SERVER_TIMEOUT,
+    'max_requests': settings.SERVER_MAX_REQUESTS,
+    'max_requests_jitter': settings.SERVER_MAX_REQUESTS // 10,
+    'preload_app': True,
+    'post_fork': post_fork,
+  }
+  # Heartbeat files on tmpfs keep a slow disk from getting workers killed.
+  if os.path.isdir('/dev/shm'):
+    options['worker_tmp_dir'] = '/dev/shm'
+  return options
+
+
+class Server(BaseApplication):
+  """Gunicorn application serving ``create_app()`` with the given options."""
+
+  def __init__(self, options: dict):
+    self.options = options
+    super().__init__()
+
+  def load_config(self) -> None:
+    for key, value in self.options.items():
+      self.cfg.set(key, value)
+
+  def load(self):
+    from sqlalchemy import text
+    from app.core.database import get_engine
+    from app.main import create_app
+    app = create_app()
+    with get_engine().connect() as connection:
+      connection.execute(text('SELECT 1'))
+    return app
+
+
+def main() -> None:
+  Server(worker_options()).run()
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,363 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Optional
+from app.core.database import AsyncSessionLocal
+from app.models.task_models import Task
+from app.schemas.task_schemas import TaskBulkUpdate, TaskCreate, TaskMove, TaskUpdate
+from app.services import task_service
+
+# Each coroutine runs the matching task_service function through
+# ``AsyncSession.run_sync`` so the query logic lives in a single place while
+# the I/O goes through the async driver without borrowing a threadpool slot.
+
+
+async def get_task_revision(user_id: int, db: AsyncSession) -> int:
+  """Async variant of ``task_service.get_task_revision``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    int: Current revision, 0 when the user does not exist.
+  """
+  return await db.run_sync(lambda session: task_service.get_task_revision(user_id, session))
+
+
+async def get_task_revision_for_task(task_id: int, db: AsyncSession) -> Optional[int]:
+  """Async variant of ``task_service.get_task_revision_for_task``.
+
+  Args:
+    task_id (int): Identifier of the task.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    Optional[int]: Revision of the last write to the task, None when it does not exist.
+  """
+  return await db.run_sync(lambda session: task_service.get_task_revision_for_task(task_id, session))
+
+
+async def create_task(task: TaskCreate, user_id: int, db: AsyncSession):
+  """Async variant of ``task_service.create_task``.
+
+  Args:
+    task (TaskCreate): Validated payload with task attributes.
+    user_id (int): Identifier of the user that will own the task.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    Task: ORM instance refreshed with its database identifier.
+  """
+  return await db.run_sync(lambda session: task_service.create_task(task, user_id, session))
+
+
+async def get_all_tasks(
+  db: AsyncSession,
+  limit: int = task_service.DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> dict:
+  """Async variant of ``task_service.get_all_tasks``.
+
+  Args:
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
+  """
+  return await db.run_sync(
+    lambda session: task_service.get_all_tasks(session, limit, after, completed, task_type)
+  )
+
+
+async def get_all_tasks_json(
+  db: AsyncSession,
+  limit: int = task_service.DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> bytes:
+  """Async variant of ``task_service.get_all_tasks_json``.
+
+  Args:
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    bytes: ``TaskPage`` serialized as JSON.
+  """
+  return await db.run_sync(
+    lambda session: task_service.get_all_tasks_json(session, limit, after, completed, task_type)
+  )
+
+
+async def get_task_by_id(task_id: int, db: AsyncSession):
+  """Async variant of ``task_service.get_task_by_id``.
+
+  Args:
+    task_id (int): Identifier of the task to retrieve.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    Task | None: Matching task instance or None when it does not exist.
+  """
+  return await db.run_sync(lambda session: task_service.get_task_by_id(task_id, session))
+
+
+async def get_all_tasks_from_user(
+  user_id: int,
+  db: AsyncSession,
+  limit: int = task_service.DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> dict:
+  """Async variant of ``task_service.get_all_tasks_from_user``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
+  """
+  return await db.run_sync(
+    lambda session: task_service.get_all_tasks_from_user(user_id, session, limit, after, completed, task_type)
+  )
+
+
+async def get_cached_tasks_from_user(
+  user_id: int,
+  revision: int,
+  query: str,
+  db: AsyncSession,
+  limit: int = task_service.DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> bytes:
+  """Async variant of ``task_service.get_cached_tasks_from_user``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    revision (int): Current task revision of the owner, pages are only reused for it.
+    query (str): Raw query string, identifies the page and filters in the cache.
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    bytes: ``TaskPage`` serialized as JSON.
+  """
+  return await db.run_sync(
+    lambda session: task_service.get_cached_tasks_from_user(
+      user_id, revision, query, session, limit, after, completed, task_type
+    )
+  )
+
+
+async def search_tasks(
+  user_id: int,
+  text: str,
+  db: AsyncSession,
+  limit: int = task_service.DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> dict:
+  """Async variant of ``task_service.search_tasks``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    text (str): Words to look for, each one matched as a prefix.
+    db (AsyncSession): Async database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
+  """
+  return await db.run_sync(
+    lambda session: task_service.search_tasks(user_id, text, session, limit, after, completed, task_type)
+  )
+
+
+async def get_task_stats(user_id: int, db: AsyncSession) -> dict:
+  """Async variant of ``task_service.get_task_stats``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    dict: ``total`` and ``completed`` counts plus the same pair per category under ``by_type``.
+  """
+  return await db.run_sync(lambda session: task_service.get_task_stats(user_id, session))
+
+
+async def export_tasks(user_id: int, export_format: str) -> AsyncIterator[bytes]:
+  """Async variant of ``task_service.export_tasks``.
+
+  The rows are streamed through ``AsyncSession.stream`` instead of
+  ``run_sync``, so the download never waits on the threadpool between
+  batches. The generator owns its session because it outlives the request
+  handler.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    export_format (str): ``ndjson`` or ``csv``.
+
+  Yields:
+    bytes: Encoded batches, in position order.
+  """
+  async with AsyncSessionLocal() as db:
+    result = await db.stream(
+      select(*task_service.TASK_OUT_COLUMNS)
+      .where(Task.user_id == user_id)
+      .order_by(Task.position, Task.id)
+      .execution_options(yield_per=task_service.EXPORT_BATCH_SIZE)
+    )
+    if export_format == 'csv':
+      yield (','.join(column.key for column in task_service.TASK_OUT_COLUMNS) + '\r\n').encode()
+    async for rows in result.partitions():
+      yield task_service._export_chunk(rows, export_format)
+
+
+async def get_changes_since(user_id: int, since: int, db: AsyncSession) -> dict:
+  """Async variant of ``task_service.get_changes_since``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    since (int): Last revision the client synced.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    dict: Current ``revision``, the ``reset`` flag, ``upserts`` and deleted ids.
+  """
+  return await db.run_sync(lambda session: task_service.get_changes_since(user_id, since, session))
+
+
+async def update_task(task: TaskUpdate, task_id: int, user_id: int, db: AsyncSession):
+  """Async variant of ``task_service.update_task``.
+
+  Args:
+    task (TaskUpdate): Partial payload with the desired changes.
+    task_id (int): Identifier of the task to update.
+    user_id (int): Identifier of the authenticated user.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    TaskOut: Task as stored after the update.
+  """
+  return await db.run_sync(lambda session: task_service.update_task(task, task_id, user_id, session))
+
+
+async def move_task(task_id: int, move: TaskMove, user_id: int, db: AsyncSession):
+  """Async variant of ``task_service.move_task``.
+
+  Args:
+    task_id (int): Identifier of the task to move.
+    move (TaskMove): Neighbours the task should sit between.
+    user_id (int): Identifier of the authenticated user.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    TaskOut: Task with its new position.
+  """
+  return await db.run_sync(lambda session: task_service.move_task(task_id, move, user_id, session))
+
+
+async def delete_task(task_id: int, user_id: int, db: AsyncSession):
+  """Async variant of ``task_service.delete_task``.
+
+  Args:
+    task_id (int): Identifier of the task to delete.
+    user_id (int): Identifier of the authenticated user.
+    db (AsyncSession): Async database session injected by FastAPI.
+  """
+  return await db.run_sync(lambda session: task_service.delete_task(task_id, user_id, session))
+
+
+async def delete_completed_tasks(user_id: int, db: AsyncSession):
+  """Async variant of ``task_service.delete_completed_tasks``.
+
+  Args:
+    user_id (int): Identifier of the authenticated user.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    dict: Number of tasks removed under the ``deleted`` key.
+  """
+  return await db.run_sync(lambda session: task_service.delete_completed_tasks(user_id, session))
+
+
+async def create_tasks(tasks: List[TaskCreate], user_id: int, db: AsyncSession) -> List[dict]:
+  """Async variant of ``task_service.create_tasks``.
+
+  Args:
+    tasks (List[TaskCreate]): Validated payloads with task attributes.
+    user_id (int): Identifier of the user that will own the tasks.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    List[dict]: One result per payload, in request order.
+  """
+  return await db.run_sync(lambda session: task_service.create_tasks(tasks, user_id, session))
+
+
+async def import_tasks(tasks: List[TaskCreate], user_id: int, db: AsyncSession) -> int:
+  """Async variant of ``task_service.import_tasks``.
+
+  Args:
+    tasks (List[TaskCreate]): Validated rows of the upload.
+    user_id (int): Identifier of the user that will own the tasks.
+    db (AsyncSession): Async database session running the import.
+
+  Returns:
+    int: Number of tasks inserted.
+  """
+  return await db.run_sync(lambda session: task_service.import_tasks(tasks, user_id, session))
+
+
+async def update_tasks(tasks: List[TaskBulkUpdate], user_id: int, db: AsyncSession) -> List[dict]:
+  """Async variant of ``task_service.update_tasks``.
+
+  Args:
+    tasks (List[TaskBulkUpdate]): Partial payloads, each addressing a task by id.
+    user_id (int): Identifier of the authenticated user.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    List[dict]: One result per payload, ``not_found`` for tasks the user does not own.
+  """
+  return await db.run_sync(lambda session: task_service.update_tasks(tasks, user_id, session))
+
+
+async def delete_tasks(task_ids: List[int], user_id: int, db: AsyncSession) -> List[dict]:
+  """Async variant of ``task_service.delete_tasks``.
+
+  Args:
+    task_ids (List[int]): Identifiers of the tasks to delete.
+    user_id (int): Identifier of the authenticated user.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    List[dict]: One result per identifier, ``not_found`` for tasks the user does not own.
+  """
+  return await db.run_sync(lambda session: task_service.delete_tasks(task_ids, user_id, session))
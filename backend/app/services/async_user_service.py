@@ -0,0 +1,74 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.user_schemas import UserCreate
+from app.models.user_models import User
+from app.utils.auth import get_password_hasher
+
+
+async def create_user(user: UserCreate, db: AsyncSession):
+  """Async variant of ``user_service.create_user``.
+
+  The bcrypt hash is computed on the hashing pool before touching the session.
+
+  Args:
+    user (UserCreate): Validated payload with registration details.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    User: Newly saved user entity.
+  """
+  hashed_password = await get_password_hasher().hash_async(user.password)
+  new_user = User(
+    email=user.email,
+    hashed_password=hashed_password,
+  )
+  db.add(new_user)
+  await db.commit()
+  await db.refresh(new_user)
+  return new_user
+
+
+async def get_user_by_id(user_id: int, db: AsyncSession):
+  """Async variant of ``user_service.get_user_by_id``.
+
+  Args:
+    user_id (int): Identifier of the user to fetch.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    User | None: Matching user instance or None when it does not exist.
+  """
+  return await db.get(User, user_id)
+
+
+async def get_user_by_email(user_email: str, db: AsyncSession):
+  """Async variant of ``user_service.get_user_by_email``.
+
+  Args:
+    user_email (str): Email credential used for lookup.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    User | None: Matching user instance or None when it does not exist.
+  """
+  result = await db.execute(select(User).where(User.email == user_email))
+  return result.scalars().first()
+
+
+async def authenticate_user(user_email: str, user_password: str, db: AsyncSession):
+  """Async variant of ``auth.authenticate_user``.
+
+  Args:
+    user_email (str): Email entered by the user attempting to log in.
+    user_password (str): Plain text password to be verified.
+    db (AsyncSession): Async database session injected by FastAPI.
+
+  Returns:
+    User | bool: User instance when authentication succeeds, False otherwise.
+  """
+  user = await get_user_by_email(user_email, db)
+  if user is None:
+    return False
+  if not await get_password_hasher().verify_async(user_password, user.hashed_password):
+    return False
+  return user
@@ -0,0 +1,219 @@
+import csv
+from typing import AsyncIterator, List, Tuple
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.database import USE_PRIMARY, AsyncSessionLocal, SessionLocal
+from app.schemas.task_schemas import TaskCreate
+from app.services import async_task_service, task_service
+
+MAX_REPORTED_ERRORS = 100
+MAX_LINE_BYTES = 64 * 1024
+
+# Stands for a line, or CSV record, longer than MAX_LINE_BYTES; its content
+# is dropped as it arrives and the row is reported as an error.
+LINE_TOO_LONG = object()
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+  """Split an uploaded body into lines as the chunks arrive.
+
+  At most ``MAX_LINE_BYTES`` of an unfinished line are kept, so a body
+  without newlines cannot pile up in memory.
+
+  Args:
+    chunks (AsyncIterator[bytes]): Request body, chunk by chunk.
+
+  Yields:
+    Tuple[int, object]: Line number, starting at 1, and the line without its
+      terminator, or ``LINE_TOO_LONG``.
+  """
+  number = 0
+  pending = b''
+  skipping = False
+  async for chunk in chunks:
+    start = 0
+    while (end := chunk.find(b'\n', start)) >= 0:
+      piece, start = chunk[start:end], end + 1
+      number += 1
+      if skipping or len(pending) + len(piece) > MAX_LINE_BYTES:
+        yield number, LINE_TOO_LONG
+      else:
+        yield number, (pending + piece).rstrip(b'\r')
+      pending, skipping = b'', False
+    rest = chunk[start:]
+    if not skipping and len(pending) + len(rest) > MAX_LINE_BYTES:
+      pending, skipping = b'', True
+    elif not skipping:
+      pending += rest
+  if skipping:
+    yield number + 1, LINE_TOO_LONG
+  elif pending.strip():
+    yield number + 1, pending.rstrip(b'\r')
+
+
+def _parse_ndjson(line: bytes) -> TaskCreate:
+  return TaskCreate.model_validate_json(line)
+
+
+async def _records(chunks: AsyncIterator[bytes], import_format: str) -> AsyncIterator[Tuple[int, object]]:
+  """Turn an upload into raw records, one per task.
+
+  NDJSON records are the undecoded lines. CSV records are dicts keyed by the
+  header row; a quoted field spanning several lines is joined before it is
+  parsed.
+
+  Args:
+    chunks (AsyncIterator[bytes]): Request body, chunk by chunk.
+    import_format (str): ``ndjson`` or ``csv``.
+
+  Yields:
+    Tuple[int, object]: Line where the record starts and the record.
+  """
+  header = None
+  record, start = '', 0
+  async for number, line in _lines(chunks):
+    if line is LINE_TOO_LONG:
+      yield (start if record else number), line
+      record = ''
+      continue
+    if import_format == 'ndjson':
+      if line.strip():
+        yield number, line
+      continue
+    text = line.decode('utf-8-sig' if number == 1 else 'utf-8', errors='replace')
+    record, start = (record + '\n' + text, start) if record else (text, number)
+    # An odd number of quotes leaves a quoted field open on the next line.
+    if record.count('"') % 2:
+      if len(record) > MAX_LINE_BYTES:
+        yield start, LINE_TOO_LONG
+        record = ''
+      continue
+    fields = next(csv.reader([record]), [])
+    record = ''
+    if header is None:
+      header = [field.strip() for field in fields]
+    elif any(field.strip() for field in fields):
+      yield start, dict(zip(header, fields))
+  if record:
+    yield start, record
+
+
+def _parse_csv(row) -> TaskCreate:
+  if not isinstance(row, dict):
+    raise ValueError('Comillas sin cerrar.')
+  if row.get('description') == '':
+    row['description'] = None
+  return TaskCreate.model_validate(row)
+
+
+def _error_detail(error: Exception) -> str:
+  if isinstance(error, ValidationError):
+    return '; '.join(
+      f"{'.'.join(str(part) for part in item['loc']) or 'fila'}: {item['msg']}" for item in error.errors()
+    )
+  return str(error)
+
+
+def _validate(records: List[Tuple[int, object]], import_format: str) -> Tuple[List[TaskCreate], List[dict]]:
+  """Check a batch of raw records against the ``TaskCreate`` validators.
+
+  Args:
+    records (List[Tuple[int, object]]): Line numbers and raw records.
+    import_format (str): ``ndjson`` or ``csv``.
+
+  Returns:
+    Tuple[List[TaskCreate], List[dict]]: Valid tasks and one error per rejected record.
+  """
+  parse = _parse_ndjson if import_format == 'ndjson' else _parse_csv
+  tasks, errors = [], []
+  for number, record in records:
+    try:
+      if record is LINE_TOO_LONG:
+        raise ValueError(f'Línea de más de {MAX_LINE_BYTES} bytes.')
+      tasks.append(parse(record))
+    except (ValidationError, ValueError) as error:
+      errors.append({'line': number, 'detail': _error_detail(error)})
+  return tasks, errors
+
+
+def _store(records: List[Tuple[int, object]], import_format: str, user_id: int) -> Tuple[int, List[dict]]:
+  """Validate a batch of raw records and insert the valid ones.
+
+  Runs on the threadpool so validation does not hold the event loop.
+
+  Args:
+    records (List[Tuple[int, object]]): Line numbers and raw records.
+    import_format (str): ``ndjson`` or ``csv``.
+    user_id (int): Identifier of the user that will own the tasks.
+
+  Returns:
+    Tuple[int, List[dict]]: Tasks inserted and one error per rejected record.
+  """
+  tasks, errors = _validate(records, import_format)
+  with SessionLocal() as db:
+    return task_service.import_tasks(tasks, user_id, db), errors
+
+
+async def _store_async(records: List[Tuple[int, object]], import_format: str, user_id: int) -> Tuple[int, List[dict]]:
+  """Same as ``_store``, writing through the async engine.
+
+  Only the validation, which is pure CPU work, runs on the threadpool; the
+  insert goes through an ``AsyncSession``.
+
+  Args:
+    records (List[Tuple[int, object]]): Line numbers and raw records.
+    import_format (str): ``ndjson`` or ``csv``.
+    user_id (int): Identifier of the user that will own the tasks.
+
+  Returns:
+    Tuple[int, List[dict]]: Tasks inserted and one error per rejected record.
+  """
+  tasks, errors = await run_in_threadpool(_validate, records, import_format)
+  async with AsyncSessionLocal(info={USE_PRIMARY: True}) as db:
+    return await async_task_service.import_tasks(tasks, user_id, db), errors
+
+
+async def import_tasks(
+  chunks: AsyncIterator[bytes],
+  import_format: str,
+  user_id: int,
+  use_async: bool = False,
+) -> dict:
+  """Validate and store an NDJSON or CSV upload while it is being received.
+
+  Every ``IMPORT_BATCH_SIZE`` records are checked with the ``TaskCreate``
+  validators and committed in one statement, and the body is not read
+  further until the batch is stored, so memory stays bounded by the batch.
+  Invalid rows are skipped and reported.
+
+  Args:
+    chunks (AsyncIterator[bytes]): Request body, chunk by chunk.
+    import_format (str): ``ndjson`` or ``csv``.
+    user_id (int): Identifier of the user that will own the tasks.
+    use_async (bool): Write through the async engine instead of a synchronous session on the threadpool.
+
+  Returns:
+    dict: Counts of imported and failed rows plus the first errors.
+  """
+  imported, failed, errors = 0, 0, []
+
+  async def flush(batch):
+    nonlocal imported, failed
+    if use_async:
+      stored, rejected = await _store_async(batch, import_format, user_id)
+    else:
+      stored, rejected = await run_in_threadpool(_store, batch, import_format, user_id)
+    imported += stored
+    failed += len(rejected)
+    errors.extend(rejected[:MAX_REPORTED_ERRORS - len(errors)])
+
+  batch = []
+  async for record in _records(chunks, import_format):
+    batch.append(record)
+    if len(batch) >= settings.IMPORT_BATCH_SIZE:
+      await flush(batch)
+      batch = []
+  if batch:
+    await flush(batch)
+  return {'imported': imported, 'failed': failed, 'errors': errors}
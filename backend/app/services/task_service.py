@@ -1,14 +1,208 @@
+import csv
+import io
+import re
+from collections import Counter
 from fastapi import Depends, HTTPException
+from pydantic_core import to_json
+from sqlalchemy import Double, cast, column, delete, func, insert, literal_column, select, table, tuple_, update
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.models.task_models import Task
-from app.schemas.task_schemas import TaskCreate, TaskOut, TaskUpdate
+from typing import Iterable, Iterator, List, Optional, Tuple
+from app.core.cache import get_task_list_cache
+from app.core.config import settings
+from app.core.database import SessionLocal, get_db
+from app.core.events import record_event
+from app.models.task_models import SEARCH_CONFIG, Task, TaskCounter, TaskTombstone
+from app.models.user_models import User
+from app.schemas.task_schemas import TaskBulkUpdate, TaskCreate, TaskMove, TaskOut, TaskPage, TaskUpdate
+from app.utils.ordering import key_between, keys_after
+from app.utils.pagination import decode_cursor, encode_cursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+MAX_BULK_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv; charset=utf-8'}
+# Longest order key the position column holds.
+MAX_POSITION_LENGTH = Task.__table__.c.position.type.length
+
+# Columns of TaskOut, in the order its fields are serialized, for the paths
+# that skip ORM objects and model validation.
+TASK_OUT_COLUMNS = (
+  Task.title,
+  Task.description,
+  Task.task_type,
+  Task.completed,
+  Task.id,
+  Task.position,
+  Task.revision,
+)
+MAX_SEARCH_TERMS = 16
+# Full-text structures created next to the tasks table, see task_models.
+TASK_SEARCH_VECTOR = literal_column('tasks.search_vector')
+TASKS_FTS = table('tasks_fts', column('rowid'), column('tasks_fts'))
+
+
+def bump_revision(user_id: int, db: Session) -> int:
+  """Advance the task revision of a user inside the current transaction.
+
+  Every write to a user's tasks calls this before committing and stamps the
+  new value on the rows it writes, so the counter backs ETags and delta sync.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session running the write.
+
+  Returns:
+    int: New revision number.
+  """
+  return db.execute(
+    update(User)
+    .where(User.id == user_id)
+    .values(task_revision=User.task_revision + 1)
+    .returning(User.task_revision),
+    execution_options={'synchronize_session': False},
+  ).scalar() or 0
+
+
+def get_task_revision(user_id: int, db: Session = Depends(get_db)) -> int:
+  """Read the current task revision of a user with a primary key lookup.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    int: Current revision, 0 when the user does not exist.
+  """
+  return db.scalar(select(User.task_revision).where(User.id == user_id)) or 0
+
+
+def get_task_revision_for_task(task_id: int, db: Session = Depends(get_db)) -> Optional[int]:
+  """Read the revision that versions a single task.
+
+  Args:
+    task_id (int): Identifier of the task.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    Optional[int]: Revision of the last write to the task, None when it does not exist.
+  """
+  return db.scalar(select(Task.revision).where(Task.id == task_id))
+
+
+def _bury(task_ids: List[int], user_id: int, revision: int, db: Session) -> None:
+  """Leave a tombstone for each deleted task so delta syncs can report it.
+
+  Args:
+    task_ids (List[int]): Identifiers of the tasks just deleted.
+    user_id (int): Identifier of the former owner.
+    revision (int): Revision of the deleting write.
+    db (Session): Database session running the write.
+  """
+  db.execute(
+    insert(TaskTombstone),
+    [{'task_id': task_id, 'user_id': user_id, 'revision': revision} for task_id in task_ids],
+  )
+
+
+def _count(
+  user_id: int,
+  db: Session,
+  added: Iterable[Tuple[str, bool]] = (),
+  removed: Iterable[Tuple[str, bool]] = (),
+) -> None:
+  """Keep the user's task counters in step with a write, in its transaction.
+
+  Each counter row is upserted with ``ON CONFLICT DO UPDATE`` adding the
+  net change, so concurrent writers never lose an increment.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session running the write.
+    added (Iterable[Tuple[str, bool]]): ``(task_type, completed)`` of each task written or moved in.
+    removed (Iterable[Tuple[str, bool]]): ``(task_type, completed)`` of each task deleted or moved out.
+  """
+  deltas = Counter(added)
+  deltas.subtract(removed)
+  rows = [
+    {'user_id': user_id, 'task_type': task_type, 'completed': completed, 'count': delta}
+    for (task_type, completed), delta in deltas.items() if delta
+  ]
+  if not rows:
+    return
+  # Imported here so only the dialect in use is ever loaded.
+  if db.get_bind().dialect.name == 'postgresql':
+    from sqlalchemy.dialects.postgresql import insert as upsert
+  else:
+    from sqlalchemy.dialects.sqlite import insert as upsert
+  statement = upsert(TaskCounter)
+  statement = statement.on_conflict_do_update(
+    index_elements=[TaskCounter.user_id, TaskCounter.task_type, TaskCounter.completed],
+    set_={'count': TaskCounter.count + statement.excluded.count},
+  )
+  db.execute(statement, rows)
+
+
+def get_task_stats(user_id: int, db: Session = Depends(get_db)) -> dict:
+  """Read a user's task aggregates from the maintained counters.
+
+  Costs one lookup of at most two rows per category, however many tasks the
+  user has.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    dict: ``total`` and ``completed`` counts plus the same pair per category under ``by_type``.
+  """
+  stats = {'total': 0, 'completed': 0, 'by_type': {}}
+  counters = db.execute(
+    select(TaskCounter.task_type, TaskCounter.completed, TaskCounter.count)
+    .where(TaskCounter.user_id == user_id, TaskCounter.count > 0)
+    .order_by(TaskCounter.task_type)
+  )
+  for task_type, completed, count in counters:
+    by_type = stats['by_type'].setdefault(task_type, {'total': 0, 'completed': 0})
+    for totals in (stats, by_type):
+      totals['total'] += count
+      if completed:
+        totals['completed'] += count
+  return stats
+
+
+def _last_position(user_id: int, db: Session) -> Optional[str]:
+  """Read the order key of the user's last task.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session running the write.
+
+  Returns:
+    Optional[str]: Highest position of the user, None when there are no tasks.
+  """
+  return db.scalar(select(func.max(Task.position)).where(Task.user_id == user_id))
+
+
+def _next_position(user_id: int, db: Session) -> str:
+  """Compute the order key that places a new task after every existing one.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session running the write.
+
+  Returns:
+    str: Order key greater than the user's current last position.
+  """
+  return key_between(_last_position(user_id, db), None)
 
 
 def create_task(task: TaskCreate, user_id: int, db: Session = Depends(get_db)) -> TaskOut:
   """Persist a new task belonging to the provided user.
 
+  The task is appended after the user's last task and a ``created`` event is
+  published once the transaction commits.
+
   Args:
     task (TaskCreate): Validated payload with task attributes.
     user_id (int): Identifier of the user that will own the task.
@@ -17,27 +211,134 @@ def create_task(task: TaskCreate, user_id: int, db: Session = Depends(get_db)) -
   Returns:
     TaskOut: ORM instance refreshed with its database identifier.
   """
+  revision = bump_revision(user_id, db)
   new_task = Task(
     **task.model_dump(),
     user_id=user_id,
+    position=_next_position(user_id, db),
+    revision=revision,
   )
   db.add(new_task)
+  db.flush()
+  _count(user_id, db, added=[(task.task_type, task.completed)])
+  record_event(db, user_id, 'created', revision, task=TaskOut.model_validate(new_task).model_dump())
   db.commit()
   db.refresh(new_task)
   return new_task
 
 
-def get_all_tasks(db: Session = Depends(get_db)) -> List[TaskOut]:
-  """Retrieve every task stored in the database.
+def _filter(query, completed: Optional[bool], task_type: Optional[str]):
+  """Apply the optional listing filters to a query over the tasks table.
+
+  Args:
+    query (Query): Base query over the tasks table.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    Query: Filtered query.
+  """
+  if completed is not None:
+    query = query.filter(Task.completed == completed)
+  if task_type is not None:
+    query = query.filter(Task.task_type == task_type)
+  return query
+
+
+def _paginate(
+  query,
+  limit: int,
+  after: Optional[str],
+  completed: Optional[bool],
+  task_type: Optional[str],
+  by_position: bool = False,
+) -> dict:
+  """Apply the listing filters and the keyset window to a query.
+
+  Args:
+    query (Query): Base query over the tasks table.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+    by_position (bool): Order by ``(position, id)`` instead of ``id`` alone.
+
+  Returns:
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
+  """
+  keys = (Task.position, Task.id) if by_position else (Task.id,)
+  query = _filter(query, completed, task_type)
+  if after is not None:
+    last = decode_cursor(after, (str, int) if by_position else (int,))
+    query = query.filter(tuple_(*keys) > tuple(last))
+  rows = query.order_by(*keys).limit(limit + 1).all()
+  items = rows[:limit]
+  next_cursor = None
+  if len(rows) > limit:
+    next_cursor = encode_cursor(*(getattr(items[-1], key.key) for key in keys))
+  return {"items": items, "next_cursor": next_cursor}
+
+
+def get_all_tasks(
+  db: Session = Depends(get_db),
+  limit: int = DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> dict:
+  """Retrieve one page of the tasks stored in the database.
 
   Args:
     db (Session): Database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
 
   Returns:
-    List[TaskOut]: Collection of persisted tasks.
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
   """
-  tasks = db.query(Task).all()
-  return tasks
+  return _paginate(db.query(Task), limit, after, completed, task_type)
+
+
+def _page_json(page: dict) -> bytes:
+  """Serialize a page of ``TASK_OUT_COLUMNS`` rows in a single pass.
+
+  Args:
+    page (dict): Result of ``_paginate`` over a column query.
+
+  Returns:
+    bytes: JSON document shaped like ``TaskPage``.
+  """
+  return to_json({
+    'items': [row._asdict() for row in page['items']],
+    'next_cursor': page['next_cursor'],
+  })
+
+
+def get_all_tasks_json(
+  db: Session = Depends(get_db),
+  limit: int = DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> bytes:
+  """Fast path of ``get_all_tasks`` that returns the serialized page.
+
+  Only the ``TaskOut`` columns are selected, as tuples, and the whole page is
+  encoded at once without building ORM objects or pydantic models.
+
+  Args:
+    db (Session): Database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    bytes: ``TaskPage`` serialized as JSON.
+  """
+  return _page_json(_paginate(db.query(*TASK_OUT_COLUMNS), limit, after, completed, task_type))
 
 
 def get_task_by_id(task_id: int, db: Session = Depends(get_db)):
@@ -53,77 +354,646 @@ def get_task_by_id(task_id: int, db: Session = Depends(get_db)):
   return db.query(Task).filter(Task.id == task_id).first()
 
 
-def get_all_tasks_from_user(user_id: int, db: Session = Depends(get_db)):
-  """Return every task assigned to a given user.
+def get_all_tasks_from_user(
+  user_id: int,
+  db: Session = Depends(get_db),
+  limit: int = DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> dict:
+  """Return one page of the tasks assigned to a given user, in position order.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
+  """
+  query = db.query(Task).filter(Task.user_id == user_id)
+  return _paginate(query, limit, after, completed, task_type, by_position=True)
+
+
+def get_all_tasks_from_user_json(
+  user_id: int,
+  db: Session = Depends(get_db),
+  limit: int = DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> bytes:
+  """Fast path of ``get_all_tasks_from_user`` that returns the serialized page.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    db (Session): Database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    bytes: ``TaskPage`` serialized as JSON.
+  """
+  query = db.query(*TASK_OUT_COLUMNS).filter(Task.user_id == user_id)
+  return _page_json(_paginate(query, limit, after, completed, task_type, by_position=True))
+
+
+def get_cached_tasks_from_user(
+  user_id: int,
+  revision: int,
+  query: str,
+  db: Session = Depends(get_db),
+  limit: int = DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> bytes:
+  """Serve a page of ``get_all_tasks_from_user`` through the task list cache.
 
   Args:
     user_id (int): Identifier of the task owner.
+    revision (int): Current task revision of the owner, pages are only reused for it.
+    query (str): Raw query string, identifies the page and filters in the cache.
     db (Session): Database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
 
   Returns:
-    List[Task]: Tasks that belong to the requested user.
+    bytes: ``TaskPage`` serialized as JSON.
   """
-  return db.query(Task).filter(Task.user_id == user_id).all()
+  page = get_task_list_cache().get(user_id, revision, query)
+  if page is None:
+    if settings.TASK_JSON_FAST_PATH:
+      page = get_all_tasks_from_user_json(user_id, db, limit, after, completed, task_type)
+    else:
+      tasks = get_all_tasks_from_user(user_id, db, limit, after, completed, task_type)
+      page = TaskPage.model_validate(tasks).model_dump_json().encode()
+    get_task_list_cache().set(user_id, revision, query, page)
+  return page
+
+
+def _search_query(terms: List[str], db: Session):
+  """Build the full-text match for the dialect the session is bound to.
 
+  Every term is matched as a prefix and all of them must appear. Postgres
+  ranks with ``ts_rank`` over the weighted ``search_vector``, SQLite with
+  FTS5's ``bm25``; in both cases a title hit outranks a description hit.
 
-def update_task(task: TaskUpdate, task_id: int, user_id, db: Session = Depends(get_db)):
+  Args:
+    terms (List[str]): Lowercased words of the search text.
+    db (Session): Database session running the search.
+
+  Returns:
+    Tuple[Query, ColumnElement]: Query of ``(Task, score)`` rows and the score, lower is better.
+  """
+  if db.get_bind().dialect.name == 'postgresql':
+    tsquery = func.to_tsquery(SEARCH_CONFIG, ' & '.join(f'{term}:*' for term in terms))
+    # ts_rank is a real; widening it keeps the cursor value exact.
+    score = cast(-func.ts_rank(TASK_SEARCH_VECTOR, tsquery), Double)
+    return db.query(Task, score).filter(TASK_SEARCH_VECTOR.op('@@')(tsquery)), score
+  score = func.bm25(literal_column('tasks_fts'), 2.0, 1.0)
+  match = ' '.join(f'"{term}"*' for term in terms)
+  query = db.query(Task, score).join(TASKS_FTS, TASKS_FTS.c.rowid == Task.id).filter(TASKS_FTS.c.tasks_fts.op('MATCH')(match))
+  return query, score
+
+
+def search_tasks(
+  user_id: int,
+  text: str,
+  db: Session = Depends(get_db),
+  limit: int = DEFAULT_PAGE_SIZE,
+  after: Optional[str] = None,
+  completed: Optional[bool] = None,
+  task_type: Optional[str] = None,
+) -> dict:
+  """Return one page of a user's tasks matching a text, best matches first.
+
+  The title and description are searched through the full-text index, so
+  the cost depends on the matches and not on the size of the user's history.
+  Pages are keyed by ``(score, id)``.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    text (str): Words to look for, each one matched as a prefix.
+    db (Session): Database session injected by FastAPI.
+    limit (int): Maximum number of tasks to return.
+    after (Optional[str]): Cursor returned by the previous page.
+    completed (Optional[bool]): Only keep tasks with this completion flag.
+    task_type (Optional[str]): Only keep tasks of this category.
+
+  Returns:
+    dict: Page with the ``items`` found and the ``next_cursor`` to continue.
+  """
+  terms = re.findall(r'\w+', text.lower())[:MAX_SEARCH_TERMS]
+  if not terms:
+    return {"items": [], "next_cursor": None}
+  query, score = _search_query(terms, db)
+  query = _filter(query.filter(Task.user_id == user_id), completed, task_type)
+  if after is not None:
+    query = query.filter(tuple_(score, Task.id) > tuple(decode_cursor(after, (float, int))))
+  rows = query.order_by(score, Task.id).limit(limit + 1).all()
+  items = rows[:limit]
+  next_cursor = None
+  if len(rows) > limit:
+    task, last_score = items[-1]
+    next_cursor = encode_cursor(last_score, task.id)
+  return {"items": [task for task, _ in items], "next_cursor": next_cursor}
+
+
+def _export_chunk(rows, export_format: str) -> bytes:
+  """Encode one batch of exported rows.
+
+  Args:
+    rows (Sequence[Row]): Rows of ``TASK_OUT_COLUMNS``.
+    export_format (str): ``ndjson`` or ``csv``.
+
+  Returns:
+    bytes: Encoded batch, ready to be written to the response.
+  """
+  if export_format == 'ndjson':
+    return b''.join(to_json(row._asdict()) + b'\n' for row in rows)
+  buffer = io.StringIO()
+  csv.writer(buffer).writerows(rows)
+  return buffer.getvalue().encode()
+
+
+def export_tasks(user_id: int, export_format: str) -> Iterator[bytes]:
+  """Yield every task of a user, encoded batch by batch.
+
+  Rows come from a server side cursor ``EXPORT_BATCH_SIZE`` at a time and
+  each batch is encoded and handed out before the next one is fetched, so
+  memory stays flat whatever the number of tasks. The generator owns its
+  session because it outlives the request handler.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    export_format (str): ``ndjson`` or ``csv``.
+
+  Yields:
+    bytes: Encoded batches, in position order.
+  """
+  with SessionLocal() as db:
+    result = db.execute(
+      select(*TASK_OUT_COLUMNS)
+      .where(Task.user_id == user_id)
+      .order_by(Task.position, Task.id)
+      .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    )
+    if export_format == 'csv':
+      yield (','.join(column.key for column in TASK_OUT_COLUMNS) + '\r\n').encode()
+    for rows in result.partitions():
+      yield _export_chunk(rows, export_format)
+
+
+def get_changes_since(user_id: int, since: int, db: Session = Depends(get_db)) -> dict:
+  """Collect the task writes a client missed since the revision it holds.
+
+  Both lookups go through the ``(user_id, revision)`` indexes, so the cost
+  follows the size of the change set rather than the number of tasks. A
+  ``since`` of 0, or one ahead of the server, answers ``reset`` without any
+  rows: the client reloads its list through the paginated listing and
+  syncs from the returned revision, replaying harmlessly whatever was
+  written in between.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    since (int): Last revision the client synced.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    dict: Current ``revision``, the ``reset`` flag, ``upserts`` and deleted ids.
+  """
+  revision = get_task_revision(user_id, db)
+  if since <= 0 or since > revision:
+    return {'revision': revision, 'reset': True, 'upserts': [], 'deletes': []}
+  upserts = db.scalars(
+    select(Task).where(Task.user_id == user_id, Task.revision > since).order_by(Task.revision, Task.id)
+  ).all()
+  # A deleted id can come back on databases that reuse them, the live task wins.
+  alive = {task.id for task in upserts}
+  deletes = list(dict.fromkeys(
+    task_id for task_id in db.scalars(
+      select(TaskTombstone.task_id)
+      .where(TaskTombstone.user_id == user_id, TaskTombstone.revision > since)
+      .order_by(TaskTombstone.revision, TaskTombstone.task_id)
+    )
+    if task_id not in alive
+  ))
+  return {'revision': revision, 'reset': False, 'upserts': upserts, 'deletes': deletes}
+
+
+def _update_values(task: TaskUpdate) -> dict:
+  """Extract the columns a partial update actually sets.
+
+  Args:
+    task (TaskUpdate): Partial payload with the desired changes.
+
+  Returns:
+    dict: Column values sent by the client, without nulls for required columns.
+  """
+  values = task.model_dump(exclude_unset=True, exclude={'id'})
+  return {key: value for key, value in values.items() if value is not None or key == 'description'}
+
+
+def update_task(task: TaskUpdate, task_id: int, user_id: int, db: Session = Depends(get_db)) -> TaskOut:
   """Modify the stored attributes of an existing task.
 
+  Runs as a single ``UPDATE ... WHERE id AND user_id RETURNING`` statement,
+  preceded by a ``SELECT ... FOR UPDATE`` of the old category and flag when
+  the change moves the task between counters.
+
   Args:
     task (TaskUpdate): Partial payload with the desired changes.
     task_id (int): Identifier of the task to update.
+    user_id (int): Identifier of the authenticated user.
     db (Session): Database session injected by FastAPI.
 
+  Raises:
+    HTTPException: When the task does not exist for that user.
+
   Returns:
-    Task: Updated ORM entity synced with the database.
+    TaskOut: Task as stored after the update.
   """
-  task_db = db.query(Task).filter(Task.id == task_id and task.user_id == user_id).first()
-  task_db.title = task.title if task.title else task_db.title
-  task_db.description = task.description if task.description else task_db.description
-  task_db.task_type = task.task_type if task.task_type else task_db.task_type
-  task_db.completed = task.completed if task.completed is not None else task_db.completed
+  values = _update_values(task)
+  owned = (Task.id == task_id, Task.user_id == user_id)
+  if values:
+    revision = bump_revision(user_id, db)
+    counted = None
+    if values.keys() & {'task_type', 'completed'}:
+      counted = db.execute(select(Task.task_type, Task.completed).where(*owned).with_for_update()).first()
+    task_db = db.scalars(
+      update(Task).where(*owned).values(**values, revision=revision).returning(Task),
+      execution_options={'synchronize_session': False},
+    ).first()
+    if counted is not None:
+      _count(user_id, db, added=[(task_db.task_type, task_db.completed)], removed=[tuple(counted)])
+  else:
+    task_db = db.scalars(select(Task).where(*owned)).first()
+  if task_db is None:
+    raise HTTPException(
+      status_code=404,
+      detail="Tarea no encontrada.",
+    )
+  updated = TaskOut.model_validate(task_db)
+  if values:
+    record_event(db, user_id, 'updated', revision, task=updated.model_dump())
   db.commit()
-  db.refresh(task_db)
-  return task_db
+  return updated
 
 
-def delete_task(task_id: int, user_id: int, db: Session = Depends(get_db)):
-  """Remove a task owned by the provided user.
+def _move_bounds(task_id: int, move: TaskMove, user_id: int, db: Session) -> Tuple[Optional[str], Optional[str]]:
+  """Read the positions a moved task has to sit between.
+
+  When a single neighbour is provided the other one is found through the
+  ``(user_id, position)`` index.
 
   Args:
-    task_id (int): Identifier of the task to delete.
+    task_id (int): Identifier of the task to move.
+    move (TaskMove): Neighbours the task should sit between.
+    user_id (int): Identifier of the authenticated user.
+    db (Session): Database session running the move.
+
+  Raises:
+    HTTPException: When a neighbour does not exist for that user or the neighbours are not adjacent.
+
+  Returns:
+    Tuple[Optional[str], Optional[str]]: Positions before and after the new place, None at either end.
+  """
+  neighbour_ids = {neighbour_id for neighbour_id in (move.after_id, move.before_id) if neighbour_id is not None}
+  positions = dict(db.execute(
+    select(Task.id, Task.position).where(Task.id.in_(neighbour_ids), Task.user_id == user_id)
+  ).all())
+  if len(positions) != len(neighbour_ids):
+    raise HTTPException(
+      status_code=404,
+      detail="Tarea no encontrada.",
+    )
+  after_position = positions.get(move.after_id)
+  before_position = positions.get(move.before_id)
+  others = (Task.user_id == user_id, Task.id != task_id)
+  if move.before_id is None:
+    before_position = db.scalar(select(func.min(Task.position)).where(*others, Task.position > after_position))
+  elif move.after_id is None:
+    after_position = db.scalar(select(func.max(Task.position)).where(*others, Task.position < before_position))
+  if after_position is not None and before_position is not None and after_position >= before_position:
+    raise HTTPException(
+      status_code=400,
+      detail="Vecinos de la tarea inválidos.",
+    )
+  return after_position, before_position
+
+
+def _renumber_positions(user_id: int, revision: int, db: Session) -> None:
+  """Give every task of a user a fresh short key, keeping their order.
+
+  Args:
+    user_id (int): Identifier of the task owner.
+    revision (int): Revision the rewritten tasks are stamped with.
+    db (Session): Database session running the write.
+  """
+  task_ids = db.scalars(select(Task.id).where(Task.user_id == user_id).order_by(Task.position, Task.id)).all()
+  db.execute(
+    update(Task),
+    [
+      {'id': task_id, 'position': position, 'revision': revision}
+      for task_id, position in zip(task_ids, keys_after(None, len(task_ids)))
+    ],
+  )
+
+
+def move_task(task_id: int, move: TaskMove, user_id: int, db: Session = Depends(get_db)) -> TaskOut:
+  """Reorder a task by giving it a key between its new neighbours.
+
+  Only the moved row is rewritten, unless the new key would not fit in the
+  position column. Moving into the same gap over and over lengthens the key,
+  so the user's tasks are then renumbered with short keys first and a single
+  ``reset`` event replaces the ``updated`` one.
+
+  Args:
+    task_id (int): Identifier of the task to move.
+    move (TaskMove): Neighbours the task should sit between.
     user_id (int): Identifier of the authenticated user.
     db (Session): Database session injected by FastAPI.
 
   Raises:
-    HTTPException: When the task does not exist for that user.
+    HTTPException: When a task does not exist for that user or the neighbours are not adjacent.
+
+  Returns:
+    TaskOut: Task with its new position.
   """
-  task_db = db.query(Task).filter(Task.id == task_id and Task.user_id == user_id).first()
+  neighbour_ids = {neighbour_id for neighbour_id in (move.after_id, move.before_id) if neighbour_id is not None}
+  if not neighbour_ids or task_id in neighbour_ids:
+    raise HTTPException(
+      status_code=400,
+      detail="Vecinos de la tarea inválidos.",
+    )
+  revision = bump_revision(user_id, db)
+  position = key_between(*_move_bounds(task_id, move, user_id, db))
+  renumbered = len(position) > MAX_POSITION_LENGTH
+  if renumbered:
+    _renumber_positions(user_id, revision, db)
+    position = key_between(*_move_bounds(task_id, move, user_id, db))
+  task_db = db.scalars(
+    update(Task)
+    .where(Task.id == task_id, Task.user_id == user_id)
+    .values(position=position, revision=revision)
+    .returning(Task),
+    execution_options={'synchronize_session': False},
+  ).first()
   if task_db is None:
     raise HTTPException(
       status_code=404,
       detail="Tarea no encontrada.",
     )
-  db.delete(task_db)
+  moved = TaskOut.model_validate(task_db)
+  if renumbered:
+    record_event(db, user_id, 'reset', revision)
+  else:
+    record_event(db, user_id, 'updated', revision, task=moved.model_dump())
   db.commit()
+  return moved
 
 
-def delete_completed_tasks(user_id: int, db: Session = Depends(get_db)):
-  """Delete every completed task that belongs to the given user.
+def delete_task(task_id: int, user_id: int, db: Session = Depends(get_db)):
+  """Remove a task owned by the provided user, leaving a tombstone behind.
 
   Args:
+    task_id (int): Identifier of the task to delete.
     user_id (int): Identifier of the authenticated user.
     db (Session): Database session injected by FastAPI.
 
   Raises:
-    HTTPException: When no completed tasks exist for the user.
+    HTTPException: When the task does not exist for that user.
   """
-  task_db = db.query(Task).filter(Task.completed == True and Task.user_id == user_id).all()
-  if task_db is None:
+  # The users row is locked before the task rows, in the same order as every
+  # other write, so concurrent writes of one user cannot deadlock. A 404
+  # leaves the bump uncommitted.
+  revision = bump_revision(user_id, db)
+  deleted = db.execute(
+    delete(Task).where(Task.id == task_id, Task.user_id == user_id).returning(Task.id, Task.task_type, Task.completed),
+    execution_options={'synchronize_session': False},
+  ).first()
+  if deleted is None:
+    db.rollback()
     raise HTTPException(
       status_code=404,
-      detail="El usuario no tiene tareas completadas",
+      detail="Tarea no encontrada.",
+    )
+  _bury([deleted.id], user_id, revision, db)
+  _count(user_id, db, removed=[(deleted.task_type, deleted.completed)])
+  record_event(db, user_id, 'deleted', revision, id=deleted.id)
+  db.commit()
+
+
+def delete_completed_tasks(user_id: int, db: Session = Depends(get_db)) -> dict:
+  """Delete every completed task that belongs to the given user.
+
+  Runs as a single ``DELETE ... RETURNING`` statement, no task is loaded
+  into the session. The returned ids become tombstones and the categories
+  are taken off the counters.
+
+  Args:
+    user_id (int): Identifier of the authenticated user.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    dict: Number of tasks removed under the ``deleted`` key.
+  """
+  revision = bump_revision(user_id, db)
+  deleted = db.execute(
+    delete(Task).where(Task.user_id == user_id, Task.completed.is_(True)).returning(Task.id, Task.task_type),
+    execution_options={'synchronize_session': False},
+  ).all()
+  if not deleted:
+    db.rollback()
+    return {'deleted': 0}
+  _bury([row.id for row in deleted], user_id, revision, db)
+  _count(user_id, db, removed=[(row.task_type, True) for row in deleted])
+  for row in deleted:
+    record_event(db, user_id, 'deleted', revision, id=row.id)
+  db.commit()
+  return {'deleted': len(deleted)}
+
+
+def create_tasks(tasks: List[TaskCreate], user_id: int, db: Session = Depends(get_db)) -> List[dict]:
+  """Insert several tasks with a single ``INSERT ... RETURNING`` in one transaction.
+
+  Args:
+    tasks (List[TaskCreate]): Validated payloads with task attributes.
+    user_id (int): Identifier of the user that will own the tasks.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    List[dict]: One result per payload, in request order.
+  """
+  if not tasks:
+    return []
+  revision = bump_revision(user_id, db)
+  positions = keys_after(_last_position(user_id, db), len(tasks))
+  rows = [
+    {**task.model_dump(), 'user_id': user_id, 'position': position, 'revision': revision}
+    for task, position in zip(tasks, positions)
+  ]
+  created = db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows).all()
+  _count(user_id, db, added=[(task.task_type, task.completed) for task in tasks])
+  results = [{'id': task.id, 'status': 'created', 'task': TaskOut.model_validate(task)} for task in created]
+  for result in results:
+    record_event(db, user_id, 'created', revision, task=result['task'].model_dump())
+  db.commit()
+  return results
+
+
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_value(value) -> str:
+  """Render one value as a field of ``COPY ... FORMAT text``.
+
+  Unlike the CSV format, text keeps ``None`` (written ``\\N``) apart from
+  an empty string, which a ``NOT NULL`` title may legitimately be.
+  """
+  if value is None:
+    return '\\N'
+  if isinstance(value, bool):
+    return 't' if value else 'f'
+  return str(value).translate(COPY_ESCAPES)
+
+
+def _copy_tasks(rows: List[dict], db: Session) -> None:
+  """Load task rows with ``COPY ... FROM STDIN`` on the session's connection.
+
+  Args:
+    rows (List[dict]): Column values of the new tasks.
+    db (Session): Session bound to a psycopg2 connection.
+  """
+  columns = ('title', 'description', 'task_type', 'completed', 'user_id', 'position', 'revision')
+  buffer = io.StringIO()
+  for row in rows:
+    buffer.write('\t'.join(_copy_value(row[column]) for column in columns))
+    buffer.write('\n')
+  buffer.seek(0)
+  dbapi_connection = db.connection().connection.driver_connection
+  with dbapi_connection.cursor() as cursor:
+    cursor.copy_expert(f"COPY tasks ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)", buffer)
+
+
+def import_tasks(tasks: List[TaskCreate], user_id: int, db: Session = Depends(get_db)) -> int:
+  """Append a batch of imported tasks in one transaction.
+
+  Uses ``COPY`` on Postgres through psycopg2 and a single ``executemany``
+  ``INSERT`` elsewhere. No row is loaded back, and instead of one event per
+  task a single ``reset`` event tells stream subscribers to resync.
+
+  Args:
+    tasks (List[TaskCreate]): Validated rows of the upload.
+    user_id (int): Identifier of the user that will own the tasks.
+    db (Session): Database session running the import.
+
+  Returns:
+    int: Number of tasks inserted.
+  """
+  if not tasks:
+    return 0
+  revision = bump_revision(user_id, db)
+  positions = keys_after(_last_position(user_id, db), len(tasks))
+  rows = [
+    {**task.model_dump(), 'user_id': user_id, 'position': position, 'revision': revision}
+    for task, position in zip(tasks, positions)
+  ]
+  bind = db.get_bind()
+  if bind.dialect.name == 'postgresql' and bind.dialect.driver == 'psycopg2':
+    _copy_tasks(rows, db)
+  else:
+    db.execute(Task.__table__.insert(), rows)
+  _count(user_id, db, added=[(task.task_type, task.completed) for task in tasks])
+  record_event(db, user_id, 'reset', revision)
+  db.commit()
+  return len(rows)
+
+
+def update_tasks(tasks: List[TaskBulkUpdate], user_id: int, db: Session = Depends(get_db)) -> List[dict]:
+  """Apply several partial updates as one ``executemany`` in one transaction.
+
+  Args:
+    tasks (List[TaskBulkUpdate]): Partial payloads, each addressing a task by id.
+    user_id (int): Identifier of the authenticated user.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    List[dict]: One result per payload, ``not_found`` for tasks the user does not own.
+  """
+  if not tasks:
+    return []
+  ids = {task.id for task in tasks}
+  owned = set(db.scalars(select(Task.id).where(Task.id.in_(ids), Task.user_id == user_id)).all())
+  params = [{'id': task.id, **_update_values(task)} for task in tasks if task.id in owned]
+  params = [values for values in params if len(values) > 1]
+  counted = {}
+  if params:
+    revision = bump_revision(user_id, db)
+    recounted = {values['id'] for values in params if values.keys() & {'task_type', 'completed'}}
+    if recounted:
+      counted = {
+        row.id: (row.task_type, row.completed)
+        for row in db.execute(
+          select(Task.id, Task.task_type, Task.completed).where(Task.id.in_(recounted)).with_for_update()
+        )
+      }
+    db.execute(update(Task), [{**values, 'revision': revision} for values in params])
+  stored = {
+    task.id: TaskOut.model_validate(task)
+    for task in db.scalars(select(Task).where(Task.id.in_(owned)).execution_options(populate_existing=True))
+  }
+  if counted:
+    _count(
+      user_id,
+      db,
+      added=[(stored[task_id].task_type, stored[task_id].completed) for task_id in counted],
+      removed=counted.values(),
     )
-  for task in task_db:
-    db.delete(task)
+  for task_id in dict.fromkeys(values['id'] for values in params):
+    record_event(db, user_id, 'updated', revision, task=stored[task_id].model_dump())
+  db.commit()
+  return [
+    {'id': task.id, 'status': 'updated', 'task': stored[task.id]} if task.id in stored
+    else {'id': task.id, 'status': 'not_found'}
+    for task in tasks
+  ]
+
+
+def delete_tasks(task_ids: List[int], user_id: int, db: Session = Depends(get_db)) -> List[dict]:
+  """Delete several tasks with a single ``DELETE ... WHERE id IN`` statement.
+
+  Args:
+    task_ids (List[int]): Identifiers of the tasks to delete.
+    user_id (int): Identifier of the authenticated user.
+    db (Session): Database session injected by FastAPI.
+
+  Returns:
+    List[dict]: One result per identifier, ``not_found`` for tasks the user does not own.
+  """
+  if not task_ids:
+    return []
+  revision = bump_revision(user_id, db)
+  rows = db.execute(
+    delete(Task).where(Task.id.in_(set(task_ids)), Task.user_id == user_id).returning(Task.id, Task.task_type, Task.completed),
+    execution_options={'synchronize_session': False},
+  ).all()
+  deleted = {row.id for row in rows}
+  if deleted:
+    _bury(deleted, user_id, revision, db)
+    _count(user_id, db, removed=[(row.task_type, row.completed) for row in rows])
+    for task_id in deleted:
+      record_event(db, user_id, 'deleted', revision, id=task_id)
     db.commit()
+  else:
+    db.rollback()
+  return [{'id': task_id, 'status': 'deleted' if task_id in deleted else 'not_found'} for task_id in task_ids]
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from app.schemas.user_schemas import UserCreate
 from app.models.user_models import User
 from app.core.database import get_db
-from app.utils.auth import bcrypt_context as bc
+from app.utils.auth import get_password_hasher
 
 
 def create_user(user: UserCreate, db: Session = Depends(get_db)):
@@ -18,7 +18,7 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
   """
   new_user = User(
     email=user.email,
-    hashed_password=bc.hash(user.password),
+    hashed_password=get_password_hasher().hash(user.password),
   )
   db.add(new_user)
   db.commit()
@@ -1,15 +1,160 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from fastapi import Depends, HTTPException
-from typing import Annotated
-from passlib.context import CryptContext
+from typing import TYPE_CHECKING, Annotated
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
 from app.core.database import get_db
+from app.core import metrics
 from app.core.config import settings
+from app.core.lazy import once
 from app.models.user_models import User
 
-bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+if TYPE_CHECKING:
+  from passlib.context import CryptContext
+
+HASH_REJECTIONS = metrics.counter(
+  "password_hash_rejections_total",
+  "Hash or verify calls refused because the worker pool queue was full.",
+)
+HASH_IN_FLIGHT = metrics.gauge(
+  "password_hash_in_flight",
+  "Hash or verify calls running or queued in the worker pool.",
+)
+
+TOKEN_CACHE_REQUESTS = metrics.counter(
+  "token_cache_requests_total",
+  "Access token lookups in the verified-claims cache.",
+  ["result"],
+)
+
+
+class TokenCache:
+  """Bounded LRU of verified token claims, each kept until the token expires.
+
+  Entries are keyed by the SHA-256 digest of the token so raw credentials are
+  never held in memory longer than the request that carried them.
+  """
+
+  def __init__(self, maxsize: int):
+    self.maxsize = maxsize
+    self._entries: OrderedDict = OrderedDict()
+    self._lock = threading.Lock()
+
+  @staticmethod
+  def _key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+  def get(self, token: str):
+    """Return the cached claims for a token, or None on a miss or expiry."""
+    key = self._key(token)
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry[1] <= time.time():
+        del self._entries[key]
+        entry = None
+      if entry is not None:
+        self._entries.move_to_end(key)
+    TOKEN_CACHE_REQUESTS.inc(result='hit' if entry is not None else 'miss')
+    return entry[0] if entry is not None else None
+
+  def put(self, token: str, claims: dict, expires_at: float) -> None:
+    """Store verified claims until ``expires_at`` (a UNIX timestamp)."""
+    if self.maxsize <= 0:
+      return
+    key = self._key(token)
+    with self._lock:
+      self._entries[key] = (claims, expires_at)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.maxsize:
+        self._entries.popitem(last=False)
+
+
+class PasswordHasher:
+  """Run bcrypt hashing and verification on a dedicated, bounded thread pool.
+
+  bcrypt releases the GIL while it works, so a small pool caps the CPU spent
+  on logins and registrations without stalling the event loop or the
+  request threadpool. Calls beyond ``workers + queue_limit`` are rejected at
+  once with a 503 instead of piling up.
+
+  Attributes:
+    context (CryptContext): Passlib context holding the bcrypt configuration.
+  """
+
+  def __init__(self, context: 'CryptContext', workers: int, queue_limit: int):
+    self.context = context
+    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+    self._slots = threading.BoundedSemaphore(workers + queue_limit)
+    self._in_flight = 0
+    self._lock = threading.Lock()
+    HASH_IN_FLIGHT.add_callback(lambda: {(): self._in_flight})
+
+  def _release(self, _future: Future) -> None:
+    with self._lock:
+      self._in_flight -= 1
+    self._slots.release()
+
+  def _submit(self, fn, *args) -> Future:
+    if not self._slots.acquire(blocking=False):
+      HASH_REJECTIONS.inc()
+      raise HTTPException(
+        status_code=503,
+        detail='Servidor ocupado, intente nuevamente.',
+        headers={'Retry-After': '1'},
+      )
+    with self._lock:
+      self._in_flight += 1
+    future = self._executor.submit(fn, *args)
+    future.add_done_callback(self._release)
+    return future
+
+  def hash(self, password: str) -> str:
+    """Hash a password, blocking the calling thread until it is done."""
+    return self._submit(self.context.hash, password).result()
+
+  def verify(self, password: str, hashed_password: str) -> bool:
+    """Check a password against its hash, blocking the calling thread."""
+    return self._submit(self.context.verify, password, hashed_password).result()
+
+  async def hash_async(self, password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await asyncio.wrap_future(self._submit(self.context.hash, password))
+
+  async def verify_async(self, password: str, hashed_password: str) -> bool:
+    """Check a password against its hash without blocking the event loop."""
+    return await asyncio.wrap_future(self._submit(self.context.verify, password, hashed_password))
+
+
+@once
+def get_password_hasher() -> PasswordHasher:
+  """Build the bcrypt context and its worker pool on first use.
+
+  passlib and bcrypt are only imported once a password is hashed or checked.
+
+  Returns:
+    PasswordHasher: Process wide hasher.
+  """
+  from passlib.context import CryptContext
+  context = CryptContext(schemes=['bcrypt'], deprecated='auto', bcrypt__rounds=settings.BCRYPT_ROUNDS)
+  return PasswordHasher(context, settings.HASH_WORKERS, settings.HASH_QUEUE_LIMIT)
+
+
+@once
+def get_token_cache() -> TokenCache:
+  """Build the verified-claims cache on first use.
+
+  Returns:
+    TokenCache: Process wide cache.
+  """
+  return TokenCache(settings.TOKEN_CACHE_SIZE)
+
+
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl='auth/token')
 
 
@@ -27,7 +172,7 @@ def authenticate_user(user_email: str, user_password: str, db: Session = Depends
   user = db.query(User).filter(User.email == user_email).first()
   if user is None:
     return False
-  if bcrypt_context.verify(user_password, user.hashed_password) is None:
+  if not get_password_hasher().verify(user_password, user.hashed_password):
     return False
   return user
 
@@ -43,6 +188,7 @@ def create_token(user_email: str, user_id: int, expires_delta=timedelta):
   Returns:
     str: Encoded JWT string.
   """
+  from jose import jwt
   encode = {'sub': user_email, 'id': user_id}
   expires = datetime.now(timezone.utc) + expires_delta
   encode.update({'exp': expires})
@@ -52,6 +198,9 @@ def create_token(user_email: str, user_id: int, expires_delta=timedelta):
 def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
   """Decode the access token and return user claims.
 
+  Verified claims are cached until the token expires, so repeated requests
+  with the same token skip the signature check.
+
   Args:
     token (str): JWT supplied via the Authorization header.
 
@@ -61,6 +210,11 @@ def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
   Returns:
     dict[str, str | int]: Dictionary containing the user email and id.
   """
+  token_cache = get_token_cache()
+  claims = token_cache.get(token)
+  if claims is not None:
+    return dict(claims)
+  from jose import JWTError, jwt
   try:
     payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     user_email = payload.get('sub')
@@ -70,7 +224,10 @@ def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
         status_code=401,
         detail='El usuario no se pudo validar',
       )
-    return {'user_email': user_email, 'user_id': user_id}
+    claims = {'user_email': user_email, 'user_id': user_id}
+    if payload.get('exp') is not None:
+      token_cache.put(token, claims, float(payload['exp']))
+    return dict(claims)
   except JWTError:
     raise HTTPException(
         status_code=401,
@@ -0,0 +1,45 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+
+CACHE_CONTROL = 'private, no-cache'
+
+
+def make_etag(*parts, query: str = '') -> str:
+  """Build a strong ETag from version components and the request query.
+
+  Args:
+    *parts: Values that change whenever the representation changes.
+    query (str): Raw query string, so each page or filter gets its own tag.
+
+  Returns:
+    str: Quoted entity tag.
+  """
+  tag = '-'.join(str(part) for part in parts)
+  if query:
+    tag += '-' + hashlib.sha1(query.encode()).hexdigest()[:12]
+  return f'"{tag}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+  candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+  return '*' in candidates or any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+  """Attach validators to a response and short-circuit matching ``If-None-Match``.
+
+  Args:
+    request (Request): Incoming request carrying the client validators.
+    response (Response): Response FastAPI will use for the endpoint result.
+    etag (str): Current entity tag of the resource.
+
+  Returns:
+    Optional[Response]: A 304 response when the client copy is current, None otherwise.
+  """
+  headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+  if_none_match = request.headers.get('if-none-match')
+  if if_none_match and _matches(if_none_match, etag):
+    return Response(status_code=304, headers=headers)
+  response.headers.update(headers)
+  return None
@@ -0,0 +1,165 @@
+from typing import List, Optional
+
+# Fractional indexing keys: an integer part followed by an optional fraction,
+# compared as plain strings. Only [0-9a-z] is used so any database collation
+# sorts the keys in the same order as Python does.
+#
+# The first character of the integer part encodes its sign and length: heads
+# '0'..'h' are negative integers with 18..1 digits, heads 'i'..'z' positive
+# integers with 1..18 digits. Appending or prepending therefore grows keys
+# logarithmically, and inserting between two keys only extends the fraction.
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+_HEAD_SPLIT = BASE // 2
+INTEGER_ZERO = DIGITS[_HEAD_SPLIT] + DIGITS[0]
+SMALLEST_INTEGER = DIGITS[0] * (_HEAD_SPLIT + 1)
+
+
+def _integer_length(head: str) -> int:
+  index = DIGITS.index(head)
+  return index - _HEAD_SPLIT + 1 if index >= _HEAD_SPLIT else _HEAD_SPLIT - index
+
+
+def _integer_part(key: str) -> str:
+  length = _integer_length(key[0]) + 1
+  if length > len(key):
+    raise ValueError(f'invalid order key: {key!r}')
+  return key[:length]
+
+
+def _validate(key: str) -> None:
+  if key == SMALLEST_INTEGER:
+    raise ValueError(f'invalid order key: {key!r}')
+  fraction = key[len(_integer_part(key)):]
+  if fraction.endswith(DIGITS[0]):
+    raise ValueError(f'invalid order key: {key!r}')
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+  """Return a fraction strictly between ``a`` and ``b`` (``None`` meaning 1)."""
+  if b is not None and a >= b:
+    raise ValueError(f'{a!r} is not lower than {b!r}')
+  if b is not None:
+    n = 0
+    while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+      n += 1
+    if n > 0:
+      return b[:n] + _midpoint(a[n:], b[n:])
+  digit_a = DIGITS.index(a[0]) if a else 0
+  digit_b = DIGITS.index(b[0]) if b is not None else BASE
+  if digit_b - digit_a > 1:
+    return DIGITS[(digit_a + digit_b + 1) // 2]
+  if b is not None and len(b) > 1:
+    return b[0]
+  return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _increment_integer(x: str) -> Optional[str]:
+  head, digits = x[0], list(x[1:])
+  for i in range(len(digits) - 1, -1, -1):
+    d = DIGITS.index(digits[i]) + 1
+    if d < BASE:
+      digits[i] = DIGITS[d]
+      return head + ''.join(digits)
+    digits[i] = DIGITS[0]
+  if head == DIGITS[_HEAD_SPLIT - 1]:
+    return INTEGER_ZERO
+  if head == DIGITS[-1]:
+    return None
+  next_head = DIGITS[DIGITS.index(head) + 1]
+  if DIGITS.index(next_head) > _HEAD_SPLIT:
+    digits.append(DIGITS[0])
+  else:
+    digits.pop()
+  return next_head + ''.join(digits)
+
+
+def _decrement_integer(x: str) -> Optional[str]:
+  head, digits = x[0], list(x[1:])
+  for i in range(len(digits) - 1, -1, -1):
+    d = DIGITS.index(digits[i]) - 1
+    if d >= 0:
+      digits[i] = DIGITS[d]
+      return head + ''.join(digits)
+    digits[i] = DIGITS[-1]
+  if head == DIGITS[_HEAD_SPLIT]:
+    return DIGITS[_HEAD_SPLIT - 1] + DIGITS[-1]
+  if head == DIGITS[0]:
+    return None
+  previous_head = DIGITS[DIGITS.index(head) - 1]
+  if DIGITS.index(previous_head) < _HEAD_SPLIT - 1:
+    digits.append(DIGITS[-1])
+  else:
+    digits.pop()
+  return previous_head + ''.join(digits)
+
+
+def key_between(a: Optional[str], b: Optional[str]) -> str:
+  """Generate an order key that sorts strictly between two existing keys.
+
+  Args:
+    a (Optional[str]): Key of the previous item, None when inserting first.
+    b (Optional[str]): Key of the next item, None when inserting last.
+
+  Raises:
+    ValueError: When a key is malformed or ``a`` does not sort before ``b``.
+
+  Returns:
+    str: New key, as short as the neighbours allow.
+  """
+  if a is not None:
+    _validate(a)
+  if b is not None:
+    _validate(b)
+  if a is not None and b is not None and a >= b:
+    raise ValueError(f'{a!r} is not lower than {b!r}')
+  if a is None:
+    if b is None:
+      return INTEGER_ZERO
+    integer_b = _integer_part(b)
+    fraction_b = b[len(integer_b):]
+    if integer_b == SMALLEST_INTEGER:
+      return integer_b + _midpoint('', fraction_b)
+    if integer_b < b:
+      return integer_b
+    decremented = _decrement_integer(integer_b)
+    if decremented is None:
+      raise ValueError('cannot decrement any further')
+    return decremented
+  integer_a = _integer_part(a)
+  fraction_a = a[len(integer_a):]
+  if b is None:
+    incremented = _increment_integer(integer_a)
+    return integer_a + _midpoint(fraction_a, None) if incremented is None else incremented
+  integer_b = _integer_part(b)
+  if integer_a == integer_b:
+    return integer_a + _midpoint(fraction_a, b[len(integer_b):])
+  incremented = _increment_integer(integer_a)
+  if incremented is None:
+    raise ValueError('cannot increment any further')
+  if incremented < b:
+    return incremented
+  return integer_a + _midpoint(fraction_a, None)
+
+
+def keys_after(a: Optional[str], count: int) -> List[str]:
+  """Generate increasing order keys that all sort after an existing key.
+
+  Equivalent to chaining ``key_between(previous, None)`` but increments the
+  integer part directly, which keeps bulk appends cheap.
+
+  Args:
+    a (Optional[str]): Key of the current last item, None for an empty list.
+    count (int): Number of keys to generate.
+
+  Returns:
+    List[str]: Keys in ascending order.
+  """
+  keys = []
+  key = key_between(a, None) if count > 0 else None
+  while len(keys) < count:
+    keys.append(key)
+    incremented = _increment_integer(key) if len(key) == _integer_length(key[0]) + 1 else None
+    key = incremented or key_between(key, None)
+  return keys
@@ -0,0 +1,55 @@
+import base64
+import json
+import math
+from typing import Tuple
+from fastapi import HTTPException
+
+
+def encode_cursor(*values) -> str:
+  """Pack the keyset values of the last returned row into an opaque token.
+
+  Args:
+    *values: Column values that identify the position of the row.
+
+  Returns:
+    str: URL safe token that can be sent back as the ``after`` parameter.
+  """
+  raw = json.dumps(list(values), separators=(",", ":")).encode()
+  return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _matches(value, expected: type) -> bool:
+  # JSON booleans are ints to Python and integral scores may come back without a fraction.
+  if isinstance(value, bool):
+    return False
+  if expected is float:
+    return isinstance(value, (int, float)) and math.isfinite(value)
+  return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, types: Tuple[type, ...] = (int,)) -> list:
+  """Unpack a token produced by ``encode_cursor``.
+
+  Args:
+    cursor (str): Opaque token received from the client.
+    types (Tuple[type, ...]): Expected type of each keyset value, ``float`` also accepting integers.
+
+  Raises:
+    HTTPException: When the token is malformed or was not issued by the API.
+
+  Returns:
+    list: Keyset values stored in the token.
+  """
+  try:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+  except (ValueError, TypeError):
+    values = None
+  if not isinstance(values, list) or len(values) != len(types) or not all(
+    _matches(value, expected) for value, expected in zip(values, types)
+  ):
+    raise HTTPException(
+      status_code=400,
+      detail="Cursor inválido.",
+    )
+  return values
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from typing import AsyncIterator
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from app.core.broker import get_broker
+from app.core.config import settings
+
+RETRY_MILLISECONDS = 3000
+
+
+def format_event(event_type: str, data: dict, event_id=None) -> str:
+  """Serialize one message in the ``text/event-stream`` format.
+
+  Args:
+    event_type (str): Name the client listens for.
+    data (dict): JSON payload of the message.
+    event_id: Optional id the browser sends back as ``Last-Event-ID``.
+
+  Returns:
+    str: Message terminated by a blank line.
+  """
+  lines = [f'event: {event_type}']
+  if event_id is not None:
+    lines.append(f'id: {event_id}')
+  lines.append(f'data: {json.dumps(data, separators=(",", ":"))}')
+  return '\n'.join(lines) + '\n\n'
+
+
+async def _task_events(request: Request, user_id: int) -> AsyncIterator[str]:
+  broker = get_broker()
+  subscription = broker.subscribe(user_id)
+  try:
+    yield f'retry: {RETRY_MILLISECONDS}\n\n'
+    yield format_event('ready', {})
+    while True:
+      try:
+        item = await asyncio.wait_for(subscription.get(), timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+      except asyncio.TimeoutError:
+        if await request.is_disconnected():
+          return
+        yield ': keepalive\n\n'
+        continue
+      if item is None:
+        yield format_event('reset', {})
+        return
+      data = {key: value for key, value in item.items() if key != 'user_id'}
+      yield format_event(item['type'], data, event_id=item['revision'])
+  finally:
+    broker.unsubscribe(subscription)
+
+
+def task_event_stream(request: Request, user_id: int) -> StreamingResponse:
+  """Open a Server-Sent Events stream with the task changes of a user.
+
+  The stream starts with a ``ready`` event, after which the client should
+  load its list once and then apply the ``created``, ``updated`` and
+  ``deleted`` deltas. A ``reset`` event means deltas were lost and the list
+  must be reloaded.
+
+  Args:
+    request (Request): Incoming request, polled to detect disconnections.
+    user_id (int): Identifier of the authenticated user.
+
+  Returns:
+    StreamingResponse: Never ending ``text/event-stream`` response.
+  """
+  return StreamingResponse(
+    _task_events(request, user_id),
+    media_type='text/event-stream',
+    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+  )
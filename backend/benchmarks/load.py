@@ -0,0 +1,316 @@
+"""Drive the API through its main user flows and report latency as JSON.
+
+Usage, from the backend directory::
+
+  python -m benchmarks.load [--users 20] [--tasks 500] [--requests 500]
+    [--concurrency 16] [--mode asgi|uvicorn] [--workers 2]
+    [--scenarios login,list,create,toggle,clear] [--output result.json]
+
+Without DATABASE_URL a fresh SQLite file is created in a temporary directory.
+DATABASE_URL may point at a throwaway Postgres database instead, together
+with ``--reset`` since every table is dropped and recreated before seeding
+``--users`` accounts that own ``--tasks`` tasks each.
+
+``asgi`` mode calls the app in-process through httpx; ``uvicorn`` mode starts
+``--workers`` server processes and goes through the loopback interface.
+Each scenario runs ``--requests`` requests from ``--concurrency`` clients
+spread over the seeded accounts. SQL statements per request are read from
+the ``Server-Timing`` header, so REQUEST_PROFILING must stay on. Results of
+two commits can be compared by diffing their JSON reports.
+"""
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import httpx
+
+PASSWORD = 'benchmark'
+SCENARIOS = ('login', 'list', 'create', 'toggle', 'clear')
+TASK_TYPES = ('trabajo', 'personal', 'estudio')
+SQL_STATEMENTS = re.compile(r'db;desc="(\d+) queries"')
+
+
+class VirtualUser:
+  """Seeded account with the token and task ids a client acts with."""
+
+  def __init__(self, user_id: int, email: str):
+    self.id = user_id
+    self.email = email
+    self.headers: Dict[str, str] = {}
+    self.tasks: Dict[int, bool] = {}
+
+
+def seed(users: int, tasks: int) -> List[VirtualUser]:
+  """Recreate the schema and insert the benchmark accounts and their tasks.
+
+  Every account shares one password hash, so seeding does not pay bcrypt
+  once per user.
+
+  Args:
+    users (int): Accounts to create.
+    tasks (int): Tasks owned by each account.
+
+  Returns:
+    List[VirtualUser]: Created accounts, not yet logged in.
+  """
+  from sqlalchemy import insert, text
+  from app.core.database import Base, get_engine
+  from app.models.task_models import Task
+  from app.models.user_models import User
+  from app.utils.auth import get_password_hasher
+  from app.utils.ordering import keys_after
+
+  engine = get_engine()
+  Base.metadata.drop_all(engine)
+  Base.metadata.create_all(engine)
+  hashed = get_password_hasher().context.hash(PASSWORD)
+  positions = keys_after(None, tasks)
+  with engine.begin() as conn:
+    rows = conn.execute(
+      insert(User).returning(User.id, User.email, sort_by_parameter_order=True),
+      [{'email': f'bench{index}@example.com', 'hashed_password': hashed, 'task_revision': 1} for index in range(users)],
+    ).all()
+    for user_id, _ in rows:
+      if tasks:
+        conn.execute(Task.__table__.insert(), [
+          {
+            'title': f'Task {index}',
+            'description': 'Benchmark task' if index % 2 else None,
+            'task_type': TASK_TYPES[index % 3],
+            'completed': index % 4 == 0,
+            'user_id': user_id,
+            'position': position,
+            'revision': 1,
+          }
+          for index, position in enumerate(positions)
+        ])
+    conn.execute(text(
+      "INSERT INTO task_counters (user_id, task_type, completed, count) "
+      "SELECT user_id, task_type, completed, count(*) FROM tasks GROUP BY user_id, task_type, completed"
+    ))
+  engine.dispose()
+  return [VirtualUser(user_id, email) for user_id, email in rows]
+
+
+async def login(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+  response = await client.post('/auth/token', data={'username': user.email, 'password': PASSWORD})
+  if response.status_code == 200:
+    user.headers = {'Authorization': f"Bearer {response.json()['access_token']}"}
+  return response
+
+
+async def list_tasks(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+  return await client.get(f'/tasks/get-from-user/{user.id}', params={'limit': 100}, headers=user.headers)
+
+
+async def create(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+  payload = {'title': 'Benchmark', 'task_type': random.choice(TASK_TYPES), 'completed': random.random() < 0.25}
+  response = await client.post('/tasks/create', json=payload, headers=user.headers)
+  if response.status_code == 201:
+    user.tasks[response.json()['id']] = payload['completed']
+  return response
+
+
+async def toggle(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+  if not user.tasks:
+    return await create(client, user)
+  task_id = random.choice(list(user.tasks))
+  user.tasks[task_id] = not user.tasks[task_id]
+  return await client.put(f'/tasks/update/{task_id}', json={'completed': user.tasks[task_id]}, headers=user.headers)
+
+
+async def clear(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+  response = await client.delete('/tasks/delete_completed', headers=user.headers)
+  if response.status_code == 200:
+    user.tasks = {task_id: done for task_id, done in user.tasks.items() if not done}
+  return response
+
+
+ACTIONS = {'login': login, 'list': list_tasks, 'create': create, 'toggle': toggle, 'clear': clear}
+
+
+async def prepare(client: httpx.AsyncClient, users: List[VirtualUser]) -> None:
+  """Log every account in and remember the ids of its first tasks."""
+  for user in users:
+    response = await login(client, user)
+    response.raise_for_status()
+    page = await client.get(f'/tasks/get-from-user/{user.id}', params={'limit': 500}, headers=user.headers)
+    page.raise_for_status()
+    user.tasks = {task['id']: task['completed'] for task in page.json()['items']}
+
+
+def percentile(values: List[float], rank: float) -> float:
+  """Nearest-rank percentile of an already sorted list."""
+  if not values:
+    return 0.0
+  return values[min(len(values) - 1, max(0, math.ceil(rank / 100 * len(values)) - 1))]
+
+
+async def run_scenario(client: httpx.AsyncClient, name: str, users: List[VirtualUser], requests: int, concurrency: int) -> dict:
+  """Send ``requests`` requests of one scenario from ``concurrency`` clients.
+
+  Args:
+    client (AsyncClient): Client bound to the app or the server.
+    name (str): Scenario from ``SCENARIOS``.
+    users (List[VirtualUser]): Prepared accounts, picked at random per request.
+    requests (int): Requests to send in total.
+    concurrency (int): Requests in flight at any time.
+
+  Returns:
+    dict: Throughput, latency percentiles in milliseconds and SQL statements per request.
+  """
+  action = ACTIONS[name]
+  issued = itertools.count()
+  latencies: List[float] = []
+  statements: List[int] = []
+  errors = 0
+
+  async def worker():
+    nonlocal errors
+    while next(issued) < requests:
+      start = time.perf_counter()
+      response = await action(client, random.choice(users))
+      latencies.append((time.perf_counter() - start) * 1000)
+      errors += response.status_code >= 400
+      match = SQL_STATEMENTS.search(response.headers.get('server-timing', ''))
+      if match:
+        statements.append(int(match.group(1)))
+
+  start = time.perf_counter()
+  await asyncio.gather(*(worker() for _ in range(concurrency)))
+  elapsed = time.perf_counter() - start
+  latencies.sort()
+  statements.sort()
+  return {
+    'requests': len(latencies),
+    'errors': errors,
+    'throughput_rps': round(len(latencies) / elapsed, 1),
+    'latency_ms': {
+      'p50': round(percentile(latencies, 50), 2),
+      'p95': round(percentile(latencies, 95), 2),
+      'p99': round(percentile(latencies, 99), 2),
+      'max': round(latencies[-1], 2) if latencies else 0.0,
+    },
+    'sql_statements': {
+      'mean': round(sum(statements) / len(statements), 2) if statements else None,
+      'p95': percentile(statements, 95) if statements else None,
+      'max': statements[-1] if statements else None,
+    },
+  }
+
+
+@asynccontextmanager
+async def asgi_client():
+  from app.main import create_app
+  async with httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app()), base_url='http://benchmark') as client:
+    yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(workers: int, port: int):
+  """Start uvicorn with several workers and yield a client pointed at it."""
+  process = subprocess.Popen(
+    [sys.executable, '-m', 'uvicorn', 'app.main:app', '--host', '127.0.0.1', '--port', str(port),
+     '--workers', str(workers), '--log-level', 'warning', '--no-access-log'],
+    env=os.environ.copy(),
+  )
+  try:
+    async with httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}', timeout=60.0) as client:
+      deadline = time.monotonic() + 30
+      while True:
+        try:
+          if (await client.get('/health')).status_code == 200:
+            break
+        except httpx.TransportError:
+          pass
+        if process.poll() is not None or time.monotonic() > deadline:
+          raise SystemExit('uvicorn did not start')
+        await asyncio.sleep(0.2)
+      yield client
+  finally:
+    process.terminate()
+    process.wait(timeout=30)
+
+
+def git_commit() -> Optional[str]:
+  try:
+    return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+
+async def run(args, users: List[VirtualUser]) -> dict:
+  scenarios = {}
+  clients = asgi_client() if args.mode == 'asgi' else uvicorn_client(args.workers, args.port)
+  async with clients as client:
+    await prepare(client, users)
+    for name in args.scenarios:
+      scenarios[name] = await run_scenario(client, name, users, args.requests, args.concurrency)
+  return scenarios
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--users', type=int, default=20)
+  parser.add_argument('--tasks', type=int, default=500, help='tasks seeded per user')
+  parser.add_argument('--requests', type=int, default=500, help='requests per scenario')
+  parser.add_argument('--concurrency', type=int, default=16)
+  parser.add_argument('--mode', choices=('asgi', 'uvicorn'), default='asgi')
+  parser.add_argument('--workers', type=int, default=2, help='uvicorn processes in uvicorn mode')
+  parser.add_argument('--port', type=int, default=8799)
+  parser.add_argument('--scenarios', type=lambda value: value.split(','), default=list(SCENARIOS))
+  parser.add_argument('--reset', action='store_true', help='allow dropping the tables of DATABASE_URL')
+  parser.add_argument('--seed', type=int, default=0, help='random seed for the request mix')
+  parser.add_argument('--output', help='write the JSON report to this file instead of stdout')
+  args = parser.parse_args()
+  unknown = set(args.scenarios) - set(SCENARIOS)
+  if unknown:
+    parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+  if os.environ.get('DATABASE_URL') and not args.reset:
+    parser.error('DATABASE_URL is set, pass --reset to drop and reseed that database')
+
+  workdir = tempfile.mkdtemp(prefix='todo-bench-')
+  os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+  os.environ.setdefault('SECRET_KEY', 'benchmark')
+  os.environ.setdefault('ALGORITHM', 'HS256')
+  os.environ['REQUEST_PROFILING'] = 'true'
+  # Every virtual user logs in from the same address.
+  os.environ['RATE_LIMIT_ENABLED'] = 'false'
+  random.seed(args.seed)
+
+  users = seed(args.users, args.tasks)
+  scenarios = asyncio.run(run(args, users))
+  report = {
+    'commit': git_commit(),
+    'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    'database': os.environ['DATABASE_URL'].split(':', 1)[0],
+    'mode': args.mode,
+    'workers': args.workers if args.mode == 'uvicorn' else 1,
+    'users': args.users,
+    'tasks_per_user': args.tasks,
+    'requests_per_scenario': args.requests,
+    'concurrency': args.concurrency,
+    'scenarios': scenarios,
+  }
+  payload = json.dumps(report, indent=2)
+  if args.output:
+    with open(args.output, 'w') as output:
+      output.write(payload + '\n')
+  else:
+    print(payload)
+
+
+if __name__ == '__main__':
+  main()
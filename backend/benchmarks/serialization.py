@@ -0,0 +1,107 @@
+"""Compare the per-row cost of the TaskOut listing path with the JSON fast path.
+
+Usage, from the backend directory::
+
+  python -m benchmarks.serialization [--rows 20000] [--repeat 5]
+
+Both paths are timed through ``GET /tasks/`` with ``TASK_JSON_FAST_PATH`` off
+and on, so the baseline is whatever the installed FastAPI does with a
+``response_model``: validation, dumping and rendering the response. Runs
+against a fresh SQLite file unless DATABASE_URL is set, so the figures cover
+query, row handling and serialization but not network latency.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import List, Tuple
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='todo-bench-'), 'bench.db')}")
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+# Only the serialization should differ between the two paths.
+os.environ['REQUEST_PROFILING'] = 'false'
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app.core.config import get_settings  # noqa: E402
+from app.core.database import Base, SessionLocal, get_engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.models.task_models import Task  # noqa: E402
+from app.models.user_models import User  # noqa: E402
+from app.services import task_service  # noqa: E402
+from app.utils.ordering import key_between  # noqa: E402
+
+
+def seed(db, rows: int) -> int:
+  """Create one user owning ``rows`` tasks and return its id."""
+  user = User(email='bench@example.com', hashed_password='x' * 60, task_revision=1)
+  db.add(user)
+  db.flush()
+  position = None
+  values = []
+  for index in range(rows):
+    position = key_between(position, None)
+    values.append({
+      'title': f'Task {index}',
+      'description': 'Benchmark task' if index % 2 else None,
+      'task_type': ('trabajo', 'personal', 'estudio')[index % 3],
+      'completed': index % 4 == 0,
+      'user_id': user.id,
+      'position': position,
+      'revision': 1,
+    })
+  db.execute(Task.__table__.insert(), values)
+  db.commit()
+  return user.id
+
+
+def fetch(client: TestClient, fast_path: bool, limit: int) -> Tuple[List[bytes], float]:
+  """Read every task through ``GET /tasks/``, ``limit`` per page.
+
+  Returns:
+    Tuple[List[bytes], float]: Bodies of the pages and the seconds spent in the requests.
+  """
+  get_settings().TASK_JSON_FAST_PATH = fast_path
+  bodies, elapsed, params = [], 0.0, {'limit': limit}
+  while True:
+    start = time.perf_counter()
+    response = client.get('/tasks/', params=params)
+    elapsed += time.perf_counter() - start
+    response.raise_for_status()
+    bodies.append(response.content)
+    cursor = json.loads(response.content)['next_cursor']
+    if cursor is None:
+      return bodies, elapsed
+    params = {'limit': limit, 'after': cursor}
+
+
+def best_of(client: TestClient, fast_path: bool, limit: int, repeat: int) -> float:
+  return min(fetch(client, fast_path, limit)[1] for _ in range(repeat))
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--rows', type=int, default=20000)
+  parser.add_argument('--repeat', type=int, default=5)
+  args = parser.parse_args()
+
+  Base.metadata.create_all(get_engine())
+  with SessionLocal() as db:
+    seed(db, args.rows)
+  with TestClient(create_app()) as client:
+    for limit in (task_service.DEFAULT_PAGE_SIZE, task_service.MAX_PAGE_SIZE):
+      orm_pages, _ = fetch(client, False, limit)
+      fast_pages, _ = fetch(client, True, limit)
+      if [json.loads(page) for page in orm_pages] != [json.loads(page) for page in fast_pages]:
+        raise SystemExit(f'paths disagree for limit={limit}')
+      orm = best_of(client, False, limit, args.repeat)
+      fast = best_of(client, True, limit, args.repeat)
+      print(
+        f'{limit:>7} rows/page  TaskOut {orm / args.rows * 1e6:7.2f} us/row  '
+        f'fast path {fast / args.rows * 1e6:7.2f} us/row  speedup x{orm / fast:.1f}'
+      )
+
+
+if __name__ == '__main__':
+  main()
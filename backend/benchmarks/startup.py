@@ -0,0 +1,87 @@
+"""Measure cold start and check it against an import-time budget.
+
+Usage, from the backend directory::
+
+  python -m benchmarks.startup [--runs 7] [--budget-ms 1500]
+
+Each run is a fresh interpreter that times ``import app.main``, building the
+application with ``create_app()`` and serving a first ``/health`` request.
+The median of the runs is printed as JSON. The command exits with status 1
+when the median import plus build time exceeds ``--budget-ms``, or when
+importing ``app.main`` already loads a module that should only be imported on
+first use (``DEFERRED_MODULES``), so it can run as a CI check.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Imported by the request paths that need them, never by ``import app.main``.
+DEFERRED_MODULES = (
+  'app.endpoints.task_ep',
+  'app.endpoints.user_ep',
+  'jose',
+  'passlib',
+  'psycopg2',
+  'asyncpg',
+  'sqlalchemy.dialects.postgresql',
+)
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+loaded = [name for name in {deferred!r} if name in sys.modules]
+application = app.main.create_app()
+built = time.perf_counter()
+from fastapi.testclient import TestClient
+TestClient(application).get('/health').raise_for_status()
+served = time.perf_counter()
+print(json.dumps({{
+  'import_ms': (imported - start) * 1000,
+  'create_app_ms': (built - imported) * 1000,
+  'first_request_ms': (served - built) * 1000,
+  'loaded_on_import': loaded,
+}}))
+"""
+
+
+def probe() -> dict:
+  """Run one cold start in a new interpreter and return its timings."""
+  env = os.environ.copy()
+  env.setdefault('DATABASE_URL', 'sqlite://')
+  env.setdefault('SECRET_KEY', 'benchmark')
+  env.setdefault('ALGORITHM', 'HS256')
+  result = subprocess.run(
+    [sys.executable, '-c', PROBE.format(deferred=DEFERRED_MODULES)],
+    capture_output=True, text=True, env=env, check=True,
+  )
+  return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--runs', type=int, default=7)
+  parser.add_argument('--budget-ms', type=float, default=1500.0, help='maximum median of import plus create_app')
+  args = parser.parse_args()
+
+  runs = [probe() for _ in range(args.runs)]
+  report = {
+    key: round(statistics.median(run[key] for run in runs), 1)
+    for key in ('import_ms', 'create_app_ms', 'first_request_ms')
+  }
+  report['startup_ms'] = round(statistics.median(run['import_ms'] + run['create_app_ms'] for run in runs), 1)
+  report['budget_ms'] = args.budget_ms
+  report['loaded_on_import'] = sorted({name for run in runs for name in run['loaded_on_import']})
+  print(json.dumps(report, indent=2))
+  if report['loaded_on_import']:
+    raise SystemExit(f"imported eagerly: {', '.join(report['loaded_on_import'])}")
+  if report['startup_ms'] > args.budget_ms:
+    raise SystemExit(f"startup took {report['startup_ms']} ms, budget is {args.budget_ms} ms")
+
+
+if __name__ == '__main__':
+  main()
@@ -5,28 +5,62 @@ const GET_ALL_FROM_USER = `${BASE_URL}/tasks/get-from-user/`
 const CREATE_TASK = `${BASE_URL}/tasks/create/`
 const UPDATE_TASK = `${BASE_URL}/tasks/update/`
 const DELETE_TASK = `${BASE_URL}/tasks/delete/`
+const MOVE_TASK = `${BASE_URL}/tasks/move/`
 const DELETE_COMPLETED_TASKS = `${BASE_URL}/tasks/delete_completed`
+const BULK_CREATE_TASKS = `${BASE_URL}/tasks/bulk/create`
+const BULK_UPDATE_TASKS = `${BASE_URL}/tasks/bulk/update`
+const BULK_DELETE_TASKS = `${BASE_URL}/tasks/bulk/delete`
+const TASK_STREAM = `${BASE_URL}/tasks/stream`
+const SYNC_TASKS = `${BASE_URL}/tasks/sync`
+const DEFAULT_RETRY_MS = 3000
 
 
 /**
- * Fetch every task that belongs to the provided user.
+ * Fetch every task that belongs to the provided user, following the pagination cursors.
  * @param {number} userID - Identifier of the task owner.
  * @param {string} token - Bearer token used to authorize the request.
  * @returns {Promise<Array<Record<string, unknown>> | undefined>} Collection of tasks when successful.
  */
 export async function getAllTasksFromUser(userID, token){
   try {
-    const response = await axios.get(`${GET_ALL_FROM_USER}${userID}`, {
-      headers: {
-        'Authorization': `Bearer ${token}`,
-      },}
-    )
-    return response.data
+    const tasks = []
+    let after = null
+    do {
+      const response = await axios.get(`${GET_ALL_FROM_USER}${userID}`, {
+        headers: {
+          'Authorization': `Bearer ${token}`,
+        },
+        params: after ? { after } : {},
+      })
+      tasks.push(...response.data.items)
+      after = response.data.next_cursor
+    } while (after)
+    return tasks
   } catch(error){
     console.error(`Error al traer tareas: ${error}`)
   }
 }
 
+/**
+ * Fetch the task changes made after a revision the client already holds.
+ * @param {number} since - Revision returned by the previous sync, 0 on the first call.
+ * @param {string} token - Bearer token used to authorize the request.
+ * @returns {Promise<{ revision: number, reset: boolean, upserts: Array<Record<string, unknown>>, deletes: Array<number> } | undefined>} Change set when successful.
+ */
+export async function getTaskChanges(since, token) {
+  try {
+    const response = await axios.get(SYNC_TASKS, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      },
+      params: { since },
+    })
+    return response.data
+  } catch(error) {
+    console.error(`Error al sincronizar tareas: ${error}`)
+  }
+}
+
 /**
  * Create a new task for the authenticated user.
  * @param {{ title: string, description?: string, task_type: string, completed?: boolean }} taskData - Task payload.
@@ -65,6 +99,26 @@ export async function updateTask(taskID, task, token){
   }
 }
 
+/**
+ * Move a task between two neighbours of the user's list.
+ * @param {number} taskID - Identifier of the task to move.
+ * @param {{ after_id?: number | null, before_id?: number | null }} neighbours - Tasks that will surround the moved one.
+ * @param {string} token - Bearer token used to authorize the request.
+ * @returns {Promise<Record<string, unknown> | undefined>} Moved task with its new position.
+ */
+export async function moveTask(taskID, neighbours, token){
+  try {
+    const response = await axios.put(`${MOVE_TASK}${taskID}`, neighbours, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    })
+    return response.data
+  } catch(error) {
+    console.error(`Error: ${error}`)
+  }
+}
+
 /**
  * Delete a task owned by the authenticated user.
  * @param {number} taskID - Identifier of the task to remove.
@@ -101,3 +155,151 @@ export async function deleteCompletedTasks(token) {
     console.error(`Error: ${error}`)
   }
 }
+
+/**
+ * Create several tasks in a single request.
+ * @param {Array<{ title: string, description?: string, task_type: string, completed?: boolean }>} tasks - Task payloads.
+ * @param {string} token - Bearer token used to authorize the request.
+ * @returns {Promise<Array<Record<string, unknown>> | undefined>} Per task results returned by the backend.
+ */
+export async function bulkCreateTasks(tasks, token) {
+  try {
+    const response = await axios.post(BULK_CREATE_TASKS, tasks, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    })
+    return response.data
+  } catch(error) {
+    console.error(`Error: ${error}`)
+  }
+}
+
+/**
+ * Apply several partial updates in a single request.
+ * @param {Array<{ id: number } & Record<string, unknown>>} tasks - Partial payloads, each with the task id.
+ * @param {string} token - Bearer token used to authorize the request.
+ * @returns {Promise<Array<Record<string, unknown>> | undefined>} Per task results returned by the backend.
+ */
+export async function bulkUpdateTasks(tasks, token) {
+  try {
+    const response = await axios.put(BULK_UPDATE_TASKS, tasks, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    })
+    return response.data
+  } catch(error) {
+    console.error(`Error: ${error}`)
+  }
+}
+
+/**
+ * Delete several tasks in a single request.
+ * @param {Array<number>} taskIDs - Identifiers of the tasks to remove.
+ * @param {string} token - Bearer token used to authorize the request.
+ * @returns {Promise<Array<Record<string, unknown>> | undefined>} Per task results returned by the backend.
+ */
+export async function bulkDeleteTasks(taskIDs, token) {
+  try {
+    const response = await axios.post(BULK_DELETE_TASKS, taskIDs, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    })
+    return response.data
+  } catch(error) {
+    console.error(`Error: ${error}`)
+  }
+}
+
+/**
+ * Split a chunk of a text/event-stream body into complete messages.
+ * @param {string} buffer - Text received so far that was not parsed yet.
+ * @returns {{ messages: Array<{ event: string, data: string, retry?: number }>, rest: string }} Parsed messages and the incomplete tail.
+ */
+function parseEventStream(buffer) {
+  const blocks = buffer.split(/\r?\n\r?\n/)
+  const rest = blocks.pop()
+  const messages = blocks.map(block => {
+    const message = { event: 'message', data: '' }
+    for (const line of block.split(/\r?\n/)) {
+      if (!line || line.startsWith(':')) {
+        continue
+      }
+      const separator = line.indexOf(':')
+      const field = separator === -1 ? line : line.slice(0, separator)
+      const value = separator === -1 ? '' : line.slice(separator + 1).replace(/^ /, '')
+      if (field === 'event') {
+        message.event = value
+      } else if (field === 'data') {
+        message.data += value
+      } else if (field === 'retry') {
+        message.retry = Number(value)
+      }
+    }
+    return message
+  })
+  return { messages, rest }
+}
+
+/**
+ * Listen to the change feed of the authenticated user's tasks, reconnecting when the stream drops.
+ * The stream is read with fetch so the bearer token travels in the Authorization header.
+ * @param {string} token - Bearer token used to authorize the request.
+ * @param {{ onReady?: () => void, onEvent?: (type: string, data: Record<string, unknown>) => void, onReset?: () => void, onDisconnect?: () => void }} handlers - Callbacks for the stream lifecycle.
+ * @returns {() => void} Function that closes the stream for good.
+ */
+export function subscribeToTaskChanges(token, handlers = {}) {
+  const controller = new AbortController()
+  let retryMs = DEFAULT_RETRY_MS
+
+  async function connect() {
+    while (!controller.signal.aborted) {
+      try {
+        const response = await fetch(TASK_STREAM, {
+          headers: {
+            'Authorization': `Bearer ${token}`,
+            'Accept': 'text/event-stream',
+          },
+          signal: controller.signal,
+        })
+        if (!response.ok || !response.body) {
+          throw new Error(`HTTP ${response.status}`)
+        }
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+        let buffer = ''
+        while (true) {
+          const { value, done } = await reader.read()
+          if (done) {
+            break
+          }
+          const { messages, rest } = parseEventStream(buffer + value)
+          buffer = rest
+          for (const message of messages) {
+            if (message.retry) {
+              retryMs = message.retry
+            }
+            if (message.event === 'ready') {
+              handlers.onReady?.()
+            } else if (message.event === 'reset') {
+              handlers.onReset?.()
+            } else if (message.data) {
+              handlers.onEvent?.(message.event, JSON.parse(message.data))
+            }
+          }
+        }
+      } catch(error) {
+        if (controller.signal.aborted) {
+          return
+        }
+        console.error(`Error en el stream de tareas: ${error}`)
+      }
+      handlers.onDisconnect?.()
+      await new Promise(resolve => setTimeout(resolve, retryMs))
+    }
+  }
+
+  connect()
+  return () => controller.abort()
+}